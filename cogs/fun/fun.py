@@ -16,18 +16,18 @@ import re
 import string
 import time
 import unicodedata
-import urllib
+import urllib.parse
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path
 from random import choice, randint
-from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
 
 import discord
+import orjson  # type: ignore
 import rapidfuzz  # type: ignore
-from aiohttp import request  # type: ignore
 from core import Cog, Context, Parrot
 from discord.ext import commands, tasks
 from emojis.db.db import EMOJI_DB, Emoji
@@ -43,25 +43,23 @@ from ._flags import Category, TriviaFlag
 from ._jeyy_api_endpoints import END_POINTS
 
 COMIC_FORMAT = re.compile(r"latest|[0-9]+")
+HEX_COLOUR = re.compile(r"#(?:[0-9A-Fa-f]{3,4}|[0-9A-Fa-f]{6}|[0-9A-Fa-f]{8})")
 BASE_URL = "https://xkcd.com"
 
 with open(Path("extra/truth.txt"), "r") as f:
-    _truth = f.read()
+    _TRUTH_LINES: Tuple[str, ...] = tuple(line for line in f.read().splitlines() if line)
 
 with open(Path("extra/dare.txt"), "r") as g:
-    _dare = g.read()
-
-with open(Path("extra/lang.json"), "r") as lang:
-    lg = json.load(lang)
+    _DARE_LINES: Tuple[str, ...] = tuple(line for line in g.read().splitlines() if line)
 
 with open(Path("extra/wyr.txt"), "r") as h:
-    _wyr = h.read()
+    _WYR_LINES: Tuple[str, ...] = tuple(line for line in h.read().splitlines() if line)
 
 with open(Path("extra/nhi.txt"), "r") as i:
-    _nhi = i.read()
+    _NHI_LINES: Tuple[str, ...] = tuple(line for line in i.read().splitlines() if line)
 
 with open(Path("extra/twister.txt"), "r") as k:
-    _twister = k.read()
+    _TWISTER_LINES: Tuple[str, ...] = tuple(line for line in k.read().splitlines() if line)
 
 with open(Path("extra/anagram.json"), "r") as l:
     ANAGRAMS_ALL = json.load(l)
@@ -71,6 +69,15 @@ with open(Path("extra/random_sentences.txt"), "r") as m:
 
 _EXECUTOR = ThreadPoolExecutor(10)
 
+_ANIMAL_SLUGS: Dict[str, str] = {
+    "dog": "dog",
+    "cat": "cat",
+    "panda": "panda",
+    "fox": "fox",
+    "bird": "birb",
+    "koala": "koala",
+}
+
 FILENAME_STRING = "{effect}_{author}.png"
 THUMBNAIL_SIZE = (80, 80)
 
@@ -99,7 +106,7 @@ IMAGES = {
 }
 
 
-response = [
+response = (
     "All signs point to yes...",
     "Yes!",
     "My sources say nope.",
@@ -120,7 +127,7 @@ response = [
     "Probably",
     "Can't say",
     "Well well...",
-]
+)
 
 UWU_WORDS = {
     "fi": "fwi",
@@ -153,6 +160,7 @@ RULES = (
 
 WIKI_FEED_API_URL = "https://en.wikipedia.org/api/rest_v1/feed/featured/{date}"
 TRIVIA_QUIZ_ICON = "https://raw.githubusercontent.com/python-discord/branding/main/icons/trivia_quiz/trivia-quiz-dist.png"
+SRAPI_CANVAS = "https://some-random-api.ml/canvas"
 
 
 async def in_executor(func: Callable[..., T], *args) -> T:
@@ -165,6 +173,67 @@ async def in_executor(func: Callable[..., T], *args) -> T:
     return await loop.run_in_executor(_EXECUTOR, func, *args)
 
 
+def _canvas(endpoint: str, **params: Any) -> str:
+    """Build a some-random-api canvas URL with properly encoded query parameters."""
+    return f"{SRAPI_CANVAS}/{endpoint}?{urllib.parse.urlencode(params)}"
+
+
+async def _get_json(session: Any, url: str) -> Tuple[int, Optional[Any]]:
+    """Fetch `url` and return the status along with the JSON body, if the request succeeded."""
+    async with session.get(url) as response:
+        if response.status != 200:
+            return response.status, None
+        return response.status, await response.json(loads=orjson.loads)
+
+
+class TTLCache:
+    """A small URL to JSON cache, entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 600) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+
+    async def get_or_fetch(
+        self, session: Any, url: str, *, ttl: Optional[float] = None
+    ) -> Tuple[int, Optional[Any]]:
+        now = time.monotonic()
+        entry = self._cache.pop(url, None)
+        if entry is not None and entry[0] > now:
+            self._cache[url] = entry
+            return 200, entry[1]
+
+        status, data = await _get_json(session, url)
+        if data is not None:
+            while len(self._cache) >= self.maxsize:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[url] = (now + (ttl or self.ttl), data)
+        return status, data
+
+
+class LazyEmbeds(Sequence[discord.Embed]):
+    """A sequence of embeds which are only built when a page is first viewed."""
+
+    def __init__(self, total: int, factory: Callable[[int], discord.Embed]) -> None:
+        self._total = total
+        self._factory = factory
+        self._cache: Dict[int, discord.Embed] = {}
+
+    def __len__(self) -> int:
+        return self._total
+
+    def __getitem__(self, index: int) -> discord.Embed:  # type: ignore
+        if index < 0:
+            index += self._total
+        if not 0 <= index < self._total:
+            raise IndexError("page index out of range")
+        try:
+            return self._cache[index]
+        except KeyError:
+            embed = self._cache[index] = self._factory(index)
+            return embed
+
+
 def file_safe_name(effect: str, display_name: str) -> str:
     """Returns a file safe filename based on the given effect and display name."""
     valid_filename_chars = f"-_. {string.ascii_letters}{string.digits}"
@@ -324,7 +393,7 @@ class DynamicQuestionGen:
         """Generate a binary calculation question."""
         a = random.randint(15, 20)
         b = random.randint(10, a)
-        oper = random.choice(
+        oper = choice(
             (
                 ("+", operator.add),
                 ("-", operator.sub),
@@ -345,7 +414,7 @@ class DynamicQuestionGen:
     @classmethod
     def solar_system(cls, q_format: str, a_format: str) -> QuizEntry:
         """Generate a question on the planets of the Solar System."""
-        planet = random.choice(cls.PLANETS)
+        planet = choice(cls.PLANETS)
 
         question = q_format.format(planet[0])
         answer = a_format.format(planet[1])
@@ -365,7 +434,7 @@ class DynamicQuestionGen:
     @classmethod
     def base_units_convert(cls, q_format: str, a_format: str) -> QuizEntry:
         """Generate a SI base units conversion question."""
-        unit = random.choice(list(cls.UNITS_TO_BASE_UNITS))
+        unit = choice(list(cls.UNITS_TO_BASE_UNITS))
 
         question = q_format.format(unit + " " + cls.UNITS_TO_BASE_UNITS[unit][0])
         answer = a_format.format(cls.UNITS_TO_BASE_UNITS[unit][1])
@@ -447,6 +516,8 @@ class Fun(Cog):
             int, Dict[discord.Member, int]
         ] = {}  # A variable to store temporary game player's scores.
         self.latest_comic_info: Dict[str, Union[int, str]] = {}
+        self._http_cache = TTLCache(256, 600)
+        self._srapi_sem = asyncio.Semaphore(4)
         self.categories = {
             "general": "Test your general knowledge.",
             "retro": "Questions related to retro gaming.",
@@ -495,7 +566,9 @@ class Fun(Cog):
             description=f"{colour_or_color.title()} information for {colour_mode} `{input_colour or name}`.",
             colour=discord.Color.from_rgb(*rgb),
         )
-        colour_conversions = self.get_colour_conversions(rgb)
+        colour_conversions = self.get_colour_conversions(
+            rgb, colour_name=name or "No match found"
+        )
         for colour_space, value in colour_conversions.items():
             colour_embed.add_field(name=colour_space, value=f"`{value}`", inline=True)
 
@@ -509,11 +582,15 @@ class Fun(Cog):
 
         await ctx.send(file=thumbnail_file, embed=colour_embed)
 
-    def get_colour_conversions(self, rgb: Tuple[int, int, int]) -> Dict[str, str]:
-        """Create a dictionary mapping of colour types and their values."""
-        colour_name = self._rgb_to_name(rgb)
+    def get_colour_conversions(
+        self, rgb: Tuple[int, int, int], *, colour_name: Optional[str] = None
+    ) -> Dict[str, str]:
+        """Create a dictionary mapping of colour types and their values.
+
+        Pass `colour_name` when it has already been resolved to skip the fuzzy match.
+        """
         if colour_name is None:
-            colour_name = "No match found"
+            colour_name = self._rgb_to_name(rgb) or "No match found"
         return {
             "RGB": rgb,
             "HSV": self._rgb_to_hsv(rgb),
@@ -587,6 +664,30 @@ class Fun(Cog):
             return None
         return f"#{self.colour_mapping[match]}"
 
+    async def _proxy_image(
+        self,
+        ctx: Context,
+        url: str,
+        filename: str,
+        *,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Fetch an image from `url` and reply with it as an attachment.
+
+        If `semaphore` is given, the request is only made while holding it.
+        """
+        if semaphore is None:
+            data = await self._read_url(url, **kwargs)
+        else:
+            async with semaphore:
+                data = await self._read_url(url, **kwargs)
+        await ctx.reply(file=discord.File(io.BytesIO(data), filename))
+
+    async def _read_url(self, url: str, **kwargs: Any) -> bytes:
+        async with self.bot.http_session.get(url, **kwargs) as response:
+            return await response.read()
+
     async def cog_unload(self) -> None:
         """Cancel `get_wiki_questions` task when Cog will unload."""
         self.get_wiki_questions.cancel()
@@ -679,7 +780,7 @@ class Fun(Cog):
         """Refreshes latest comic's information ever 30 minutes. Also used for finding a random comic."""
         async with self.bot.http_session.get(f"{BASE_URL}/info.0.json") as resp:
             if resp.status == 200:
-                self.latest_comic_info = await resp.json()
+                self.latest_comic_info = await resp.json(loads=orjson.loads)
 
     @tasks.loop(hours=24.0)
     async def get_wiki_questions(self) -> None:
@@ -699,7 +800,7 @@ class Fun(Cog):
                 if r.status != 200:
                     error_fetches += 1
                     continue
-                raw_json = await r.json()
+                raw_json = await r.json(loads=orjson.loads)
                 articles_raw = raw_json["mostread"]["articles"]
 
                 for article in articles_raw:
@@ -777,7 +878,7 @@ class Fun(Cog):
         else:
             async with self.bot.http_session.get(f"{BASE_URL}/{comic}/info.0.json") as resp:
                 if resp.status == 200:
-                    info = await resp.json()
+                    info = await resp.json(loads=orjson.loads)
                 else:
                     embed.title = f"XKCD comic #{comic}"
                     embed.description = f"{resp.status}: Could not retrieve xkcd comic #{comic}."
@@ -814,7 +915,7 @@ class Fun(Cog):
             await ctx.send("An anagram is already being solved in this channel!")
             return
 
-        scrambled_letters, correct = random.choice(list(ANAGRAMS_ALL.items()))
+        scrambled_letters, correct = choice(list(ANAGRAMS_ALL.items()))
 
         game = AnagramGame(scrambled_letters, correct)
         self.games[ctx.channel.id] = game
@@ -865,7 +966,7 @@ class Fun(Cog):
                 f"{ctx.author.mention} Could not get a token from the API. Please try again later"
             )
             return None
-        _data = await request_token.json()
+        _data = await request_token.json(loads=orjson.loads)
         token = _data["token"]
         with suppress(discord.Forbidden):
             await ctx.author.send(
@@ -937,7 +1038,7 @@ class Fun(Cog):
                 f"{ctx.author.mention} Could not get a question from the API. Please try again later"
             )
 
-        data = await res.json()
+        data = await res.json(loads=orjson.loads)
         if data["response_code"] in {3, 4}:
             # token expired or invalid
             return await ctx.error(
@@ -1034,7 +1135,7 @@ class Fun(Cog):
         res = await self.bot.http_session.get(
             f"https://opentdb.com/api_token.php?command=reset&token={token}",
         )
-        data = await res.json()
+        data = await res.json(loads=orjson.loads)
         if data is None:
             await ctx.error(f"{ctx.author.mention} Could not reset token. Please try again later")
         if data["response_code"] == 0:
@@ -1073,7 +1174,7 @@ class Fun(Cog):
 
         # Send embed showing available categories if inputted category is invalid.
         if category is None:
-            category = random.choice(list(self.categories))
+            category = choice(list(self.categories))
 
         category = category.lower()
         if category not in self.categories:
@@ -1136,7 +1237,7 @@ class Fun(Cog):
             if hint_no == 0:
                 # Select a random question which has not been used yet.
                 while True:
-                    question_dict = random.choice(topic)
+                    question_dict = choice(topic)
                     if question_dict["id"] not in done_questions:
                         done_questions.append(question_dict["id"])
                         break
@@ -1198,7 +1299,7 @@ class Fun(Cog):
                     if self.game_status[ctx.channel.id] is False:
                         break
 
-                    response = random.choice(WRONG_ANS_RESPONSE)
+                    response = choice(WRONG_ANS_RESPONSE)
                     await ctx.send(response)
 
                     await self.send_answer(
@@ -1270,7 +1371,7 @@ class Fun(Cog):
         """Generate an error embed with the given description."""
         error_embed = discord.Embed(
             colour=Colours.soft_red,
-            title=random.choice(NEGATIVE_REPLIES),
+            title=choice(NEGATIVE_REPLIES),
             description=f"{desc}",  # fuck you pycord
         )
 
@@ -1554,15 +1655,17 @@ class Fun(Cog):
     @Context.with_type
     async def _8ball(self, ctx: Context, *, question: commands.clean_content):
         """8ball Magic, nothing to say much"""
-        await ctx.reply(f"Question: **{question}**\nAnswer: **{random.choice(response)}**")
+        await ctx.reply(f"Question: **{question}**\nAnswer: **{choice(response)}**")
 
     @commands.command()
     @commands.max_concurrency(1, per=commands.BucketType.user)
     @Context.with_type
     async def choose(self, ctx: Context, *, options: commands.clean_content):
         """Confuse something with your decision? Let Parrot choose from your choice. NOTE: The `Options` should be seperated by commas `,`."""
-        options = options.split(",")
-        await ctx.reply(f"{ctx.author.mention} I choose {choice(options)}")
+        opts = [option.strip() for option in options.split(",") if option.strip()]
+        if not opts:
+            return await ctx.reply(f"{ctx.author.mention} you didn't give me anything to choose from")
+        await ctx.reply(f"{ctx.author.mention} I choose {choice(opts)}")
 
     @commands.group(aliases=("color",), invoke_without_command=True)
     async def colour(self, ctx: commands.Context, *, colour_input: Optional[str] = None) -> None:
@@ -1633,9 +1736,7 @@ class Fun(Cog):
         if hex_code[0] != "#":
             hex_code = f"#{hex_code}"
 
-        if len(hex_code) not in (4, 5, 7, 9) or any(
-            digit not in string.hexdigits for digit in hex_code[1:]
-        ):
+        if not HEX_COLOUR.fullmatch(hex_code):
             raise commands.BadArgument(
                 message=f"Cannot convert `{hex_code}` to a recognizable Hex format. "
                 "Hex values must be hexadecimal and take the form *#RRGGBB* or *#RGB*."
@@ -1664,7 +1765,7 @@ class Fun(Cog):
     @colour.command()
     async def random(self, ctx: commands.Context) -> None:
         """Create an embed from a randomly chosen colour."""
-        hex_colour = random.choice(list(self.colour_mapping.values()))
+        hex_colour = choice(list(self.colour_mapping.values()))
         hex_tuple = ImageColor.getrgb(f"#{hex_colour}")
         await self.send_colour_response(ctx, hex_tuple)
 
@@ -1679,7 +1780,7 @@ class Fun(Cog):
             base64_bytes = base64_string.encode("ascii")
 
             sample_string_bytes = base64.b64decode(base64_bytes)
-            sample_string = sample_string_bytes.decode("ascii")
+            sample_string = sample_string_bytes.decode("utf-8")
         except (UnicodeEncodeError, UnicodeDecodeError, binascii.Error):
             await ctx.send(
                 f"{ctx.author.mention} The string you entered is not valid Base64. Please try again."
@@ -1694,10 +1795,7 @@ class Fun(Cog):
     @Context.with_type
     async def encode(self, ctx: Context, *, string: str):
         """Encode the text to Base64 Encryption"""
-        sample_string = string
-        sample_string_bytes = sample_string.encode("ascii")
-        base64_bytes = base64.b64encode(sample_string_bytes)
-        base64_string = base64_bytes.decode("ascii")
+        base64_string = base64.b64encode(string.encode("utf-8")).decode("ascii")
 
         await ctx.reply(f"{ctx.author.mention} {base64_string}")
 
@@ -1709,42 +1807,35 @@ class Fun(Cog):
         """Return a random Fact. It's useless command, I know
 
         NOTE: Available animals - Dog, Cat, Panda, Fox, Bird, Koala"""
-        if (animal := animal.lower()) in (
-            "dog",
-            "cat",
-            "panda",
-            "fox",
-            "bird",
-            "koala",
-        ):
-            fact_url = f"https://some-random-api.ml/facts/{animal}"
-            image_url = f"https://some-random-api.ml/img/{'birb' if animal == 'bird' else animal}"
-
-            async with request("GET", image_url, headers={}) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    image_link = data.get("link")
-
-            async with request("GET", fact_url, headers={}) as response:
-                if response.status == 200:
-                    data = await response.json()
-
-                    embed = discord.Embed(
-                        title=f"{animal.title()} fact",
-                        description=data["fact"],
-                        colour=ctx.author.colour,
-                    )
-                    if image_link is not None:
-                        embed.set_image(url=image_link)
-                        return await ctx.reply(embed=embed)
+        animal = animal.lower()
+        if (slug := _ANIMAL_SLUGS.get(animal)) is None:
+            return await ctx.reply(
+                f"{ctx.author.mention} no facts are available for that animal. Available animals: `dog`, `cat`, `panda`, `fox`, `bird`, `koala`"
+            )
 
-                    return await ctx.reply(
-                        f"{ctx.author.mention} API returned a {response.status} status."
-                    )
+        fact_url = f"https://some-random-api.ml/facts/{animal}"
+        image_url = f"https://some-random-api.ml/img/{slug}"
 
-                return await ctx.reply(
-                    f"{ctx.author.mention} no facts are available for that animal. Available animals: `dog`, `cat`, `panda`, `fox`, `bird`, `koala`"
-                )
+        image, fact = await asyncio.gather(
+            _get_json(self.bot.http_session, image_url),
+            _get_json(self.bot.http_session, fact_url),
+            return_exceptions=True,
+        )
+        if isinstance(fact, BaseException):
+            raise fact
+
+        status, data = fact
+        if data is None:
+            return await ctx.reply(f"{ctx.author.mention} API returned a {status} status.")
+
+        embed = discord.Embed(
+            title=f"{animal.title()} fact",
+            description=data["fact"],
+            colour=ctx.author.colour,
+        )
+        if not isinstance(image, BaseException) and image[1] is not None:
+            embed.set_image(url=image[1].get("link"))
+        await ctx.reply(embed=embed)
 
     @commands.command(aliases=["insult"])
     @commands.max_concurrency(1, per=commands.BucketType.user)
@@ -1753,25 +1844,29 @@ class Fun(Cog):
         """Insult your enemy, Ugh!"""
         member = member or ctx.author
 
-        response = await self.bot.http_session.get("https://insult.mattbas.org/api/insult")
-        insult = await response.text()
+        async with self.bot.http_session.get("https://insult.mattbas.org/api/insult") as response:
+            if response.status != 200:
+                return await ctx.reply(
+                    f"{ctx.author.mention} API returned a {response.status} status."
+                )
+            insult = await response.text()
         await ctx.reply(f"**{member.name}** {insult}")
 
     @commands.command(aliases=["its-so-stupid"])
     @commands.bot_has_permissions(attach_files=True, embed_links=True)
     @commands.max_concurrency(1, per=commands.BucketType.user)
+    @commands.cooldown(1, 3, commands.BucketType.user)
     @Context.with_type
     async def itssostupid(self, ctx: Context, *, comment: str):
         """:| I don't know what is this, I think a meme generator."""
         member = ctx.author
-        if len(comment) > 20:
-            comment = comment[:19:]
-        async with self.bot.http_session.get(
-            f"https://some-random-api.ml/canvas/its-so-stupid?avatar={member.display_avatar.url}&dog={comment}"
-        ) as itssostupid:  # get users avatar as png with 1024 size
-            imageData = io.BytesIO(await itssostupid.read())  # read the image/bytes
-
-            await ctx.reply(file=discord.File(imageData, "itssostupid.png"))  # replying the file
+        comment = comment[:20]
+        await self._proxy_image(
+            ctx,
+            _canvas("its-so-stupid", avatar=member.display_avatar.url, dog=comment),
+            "itssostupid.png",
+            semaphore=self._srapi_sem,
+        )
 
     @commands.command(name="meme")
     @commands.bot_has_permissions(embed_links=True)
@@ -1782,25 +1877,25 @@ class Fun(Cog):
         link = "https://meme-api.herokuapp.com/gimme/{}/{}".format(subreddit, count)
 
         while True:
-            response = await self.bot.http_session.get(link)
-            if response.status <= 300:
-                res = await response.json()
-                if "message" in res:
-                    await ctx.reply(res["message"])
-                    return
+            async with self.bot.http_session.get(link) as response:
+                if response.status <= 300:
+                    res = await response.json(loads=orjson.loads)
+                    if "message" in res:
+                        await ctx.reply(res["message"])
+                        return
             if not any(x["nsfw"] for x in res["memes"]):
                 break
 
             await ctx.release(0)
 
+        timestamp = discord.utils.utcnow()
+
         def make_embed(res) -> discord.Embed:
             title = res["title"]
             ups = res["ups"]
             sub = res["subreddit"]
 
-            embed = discord.Embed(
-                title=f"{title}", description=f"{sub}", timestamp=discord.utils.utcnow()
-            )
+            embed = discord.Embed(title=f"{title}", description=f"{sub}", timestamp=timestamp)
             embed.set_image(url=res["url"])
             embed.set_footer(text=f"Upvotes: {ups}")
             return embed
@@ -1818,11 +1913,10 @@ class Fun(Cog):
     async def fakepeople(self, ctx: Context):
         """Fake Identity generator."""
         link = "https://randomuser.me/api/"
-        response = await self.bot.http_session.get(link)
-        if response.status == 200:
-            res = await response.json()
-        else:
-            return
+        async with self.bot.http_session.get(link) as response:
+            if response.status != 200:
+                return
+            res = await response.json(loads=orjson.loads)
         res = res["results"][0]
         name = f"{res['name']['title']} {res['name']['first']} {res['name']['last']}"
         address = f"{res['location']['street']['number']}, {res['location']['street']['name']}, {res['location']['city']}, {res['location']['state']}, {res['location']['country']}, {res['location']['postcode']}"
@@ -1859,10 +1953,11 @@ class Fun(Cog):
     @Context.with_type
     async def translate(self, ctx: Context, to: str, *, message: str):
         """Translates a message to English (default). using My Memory"""
-        url = f"https://api.mymemory.translated.net/get?q={message}&langpair=en|{to}"
+        url = "https://api.mymemory.translated.net/get"
+        params = {"q": message[:2000], "langpair": f"en|{to.lower()}"}
 
-        resp = await ctx.session.get(url)
-        data = await resp.json()
+        async with self.bot.http_session.get(url, params=params) as resp:
+            data = await resp.json(loads=orjson.loads)
 
         return await ctx.send(
             embed=discord.Embed(description=data["responseData"]["translatedText"]).set_footer(
@@ -1891,60 +1986,67 @@ class Fun(Cog):
 
         # Thanks Danny
 
-        response = await self.bot.http_session.get(
-            f"http://api.urbandictionary.com/v0/define?term={urllib.parse.quote(text)}"
+        _, res = await self._http_cache.get_or_fetch(
+            self.bot.http_session,
+            f"http://api.urbandictionary.com/v0/define?term={urllib.parse.quote(text)}",
         )
-        if response.status == 200:
-            res = await response.json()
-        else:
+        if res is None:
             return
         if not res["list"]:
             return await ctx.reply(
                 f"{ctx.author.mention} **{t}** means nothings. Try something else"
             )
-        em_list = []
-        for i in range(0, len(res["list"])):
-            _def = res["list"][i]["definition"]
-            _link = res["list"][i]["permalink"]
-            thumbs_up = res["list"][i]["thumbs_up"]
-            thumbs_down = res["list"][i]["thumbs_down"]
-            author = res["list"][i]["author"]
-            example = res["list"][i]["example"]
-            word = res["list"][i]["word"].capitalize()
+        timestamp = discord.utils.utcnow()
+
+        entries = res["list"]
+
+        def make_embed(i: int) -> discord.Embed:
+            entry = entries[i]
+            _def = entry["definition"]
+            _link = entry["permalink"]
+            thumbs_up = entry["thumbs_up"]
+            thumbs_down = entry["thumbs_down"]
+            author = entry["author"]
+            example = entry["example"]
+            word = entry["word"].capitalize()
             embed = discord.Embed(
                 title=f"{word}",
                 description=f"{cleanup_definition(_def)}",
                 url=f"{_link}",
-                timestamp=discord.utils.utcnow(),
+                timestamp=timestamp,
             )
-            embed.add_field(name="Example", value=f"{example[:250:]}...")
+            embed.add_field(name="Example", value=f"{example[:250]}...")
             embed.set_author(name=f"Author: {author}")
             embed.set_footer(
                 text=f"\N{THUMBS UP SIGN} {thumbs_up} \N{BULLET} \N{THUMBS DOWN SIGN} {thumbs_down}"
             )
-            em_list.append(embed)
+            return embed
+
+        em_list = LazyEmbeds(len(entries), make_embed)
 
         await PaginationView(em_list).start(ctx=ctx)
 
     @commands.command(aliases=["youtube-comment", "youtube_comment"])
     @commands.bot_has_permissions(attach_files=True, embed_links=True)
     @commands.max_concurrency(1, per=commands.BucketType.user)
+    @commands.cooldown(1, 3, commands.BucketType.user)
     @Context.with_type
     async def ytcomment(self, ctx: Context, *, comment: str):
         """Makes a comment in YT. Best ways to fool your fool friends. :')"""
         member = ctx.author
-        if len(comment) > 1000:
-            comment = comment[:999:]
-        if len(member.name) > 20:
-            name = member.name[:20:]
-        else:
-            name = member.name
-        async with self.bot.http_session.get(
-            f"https://some-random-api.ml/canvas/youtube-comment?avatar={member.display_avatar.url}&username={name}&comment={comment}"
-        ) as ytcomment:  # get users avatar as png with 1024 size
-            imageData = io.BytesIO(await ytcomment.read())  # read the image/bytes
-
-            await ctx.reply(file=discord.File(imageData, "ytcomment.png"))  # replying the file
+        comment = comment[:1000]
+        name = member.name[:20]
+        await self._proxy_image(
+            ctx,
+            _canvas(
+                "youtube-comment",
+                avatar=member.display_avatar.url,
+                username=name,
+                comment=comment,
+            ),
+            "ytcomment.png",
+            semaphore=self._srapi_sem,
+        )
 
     @commands.command()
     @commands.bot_has_permissions(embed_links=True)
@@ -1952,17 +2054,16 @@ class Fun(Cog):
     @Context.with_type
     async def dare(self, ctx: Context, *, member: discord.Member = None):
         """I dared you to use this command."""
-        dare = _dare.split("\n")
         if member is None:
             em = discord.Embed(
                 title="Dare",
-                description=f"{random.choice(dare)}",
+                description=f"{choice(_DARE_LINES)}",
                 timestamp=discord.utils.utcnow(),
             )
         else:
             em = discord.Embed(
                 title=f"{member.name} Dared",
-                description=f"{random.choice(dare)}",
+                description=f"{choice(_DARE_LINES)}",
                 timestamp=discord.utils.utcnow(),
             )
 
@@ -1974,17 +2075,16 @@ class Fun(Cog):
     @commands.max_concurrency(1, per=commands.BucketType.user)
     async def wouldyourather(self, ctx: Context, *, member: discord.Member = None):
         """A classic `Would you Rather...?` game"""
-        wyr = _wyr.split("\n")
         if member is None:
             em = discord.Embed(
                 title="Would you Rather...?",
-                description=f"{random.choice(wyr)}",
+                description=f"{choice(_WYR_LINES)}",
                 timestamp=discord.utils.utcnow(),
             )
         else:
             em = discord.Embed(
                 title=f"{member.name} Would you Rather...?",
-                description=f"{random.choice(wyr)}",
+                description=f"{choice(_WYR_LINES)}",
                 timestamp=discord.utils.utcnow(),
             )
 
@@ -1996,17 +2096,16 @@ class Fun(Cog):
     @commands.max_concurrency(1, per=commands.BucketType.user)
     async def neverhaveiever(self, ctx: Context, *, member: discord.Member = None):
         """A classic `Never Have I ever...` game"""
-        nhi = _nhi.split("\n")
         if member is None:
             em = discord.Embed(
                 title="Never Have I ever...",
-                description=f"{random.choice(nhi)}",
+                description=f"{choice(_NHI_LINES)}",
                 timestamp=discord.utils.utcnow(),
             )
         else:
             em = discord.Embed(
                 title=f"{member.name} Never Have I ever...",
-                description=f"{random.choice(nhi)}",
+                description=f"{choice(_NHI_LINES)}",
                 timestamp=discord.utils.utcnow(),
             )
 
@@ -2019,18 +2118,17 @@ class Fun(Cog):
     @Context.with_type
     async def truth(self, ctx: Context, *, member: discord.Member = None):
         """Truth: Who is your crush?"""
-        t = _truth.split("\n")
         if member is None:
             em = discord.Embed(
                 title="Truth",
-                description=f"{random.choice(t)}",
+                description=f"{choice(_TRUTH_LINES)}",
                 timestamp=discord.utils.utcnow(),
             )
             em.set_footer(text=f"{ctx.author.name}")
         else:
             em = discord.Embed(
                 title=f"{member.name} reply!",
-                description=f"{random.choice(t)}",
+                description=f"{choice(_TRUTH_LINES)}",
                 timestamp=discord.utils.utcnow(),
             )
             em.set_footer(text=f"{ctx.author.name}")
@@ -2042,18 +2140,17 @@ class Fun(Cog):
     @Context.with_type
     async def twister(self, ctx: Context, *, member: discord.Member = None):
         """I scream, you scream, we all scream for ice-cream"""
-        t = _twister.split("\n")
         if member is None:
             em = discord.Embed(
                 title="Say",
-                description=f"{random.choice(t)}",
+                description=f"{choice(_TWISTER_LINES)}",
                 timestamp=discord.utils.utcnow(),
             )
             em.set_footer(text=f"{ctx.author}")
         else:
             em = discord.Embed(
                 title=f"{member} reply!",
-                description=f"{random.choice(t)}",
+                description=f"{choice(_TWISTER_LINES)}",
                 timestamp=discord.utils.utcnow(),
             )
             em.set_footer(text=f"{ctx.author}")
@@ -2092,11 +2189,12 @@ class Fun(Cog):
         """Shear image generation"""
         member = member or ctx.author
         params = {"image_url": member.display_avatar.url, "axis": axis if axis else "X"}
-        r = await self.bot.http_session.get(
-            f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
+        await self._proxy_image(
+            ctx,
+            f"https://api.jeyy.xyz/image/{ctx.command.name}",
+            f"{ctx.command.qualified_name}.gif",
+            params=params,
         )
-        file_obj = discord.File(io.BytesIO(await r.read()), f"{ctx.command.qualified_name}.gif")
-        await ctx.reply(file=file_obj)
 
     @commands.command()
     @commands.bot_has_permissions(embed_links=True, attach_files=True)
@@ -2104,12 +2202,13 @@ class Fun(Cog):
     @Context.with_type
     async def scrapbook(self, ctx: Context, *, text: commands.clean_content):
         """ScrapBook Text image generation"""
-        params = {"text": text[:20:]}
-        r = await self.bot.http_session.get(
-            f"https://api.jeyy.xyz/image/{ctx.command.name}", params=params
+        params = {"text": text[:20]}
+        await self._proxy_image(
+            ctx,
+            f"https://api.jeyy.xyz/image/{ctx.command.name}",
+            f"{ctx.command.qualified_name}.gif",
+            params=params,
         )
-        file_obj = discord.File(io.BytesIO(await r.read()), f"{ctx.command.qualified_name}.gif")
-        await ctx.reply(file=file_obj)
 
     @commands.command()
     @commands.bot_has_permissions(embed_links=True)
@@ -2143,7 +2242,7 @@ class Fun(Cog):
         )
         await ctx.release(1.5)
         await msg.edit(
-            content=f"{ctx.author.mention} you choose **{choose}**. And coin <a:E_CoinFlip:923477401806196786> landed on **{random.choice(['HEADS', 'TAILS'])}**"
+            content=f"{ctx.author.mention} you choose **{choose}**. And coin <a:E_CoinFlip:923477401806196786> landed on **{choice(['HEADS', 'TAILS'])}**"
         )
 
     @commands.command(aliases=["slot"])
@@ -2164,19 +2263,19 @@ class Fun(Cog):
 > {e} {e} {e}"""
         )
         await ctx.release(1.5)
-        _1 = random.choice(CHOICE)
+        _1 = choice(CHOICE)
         await msg.edit(
             content=f"""{ctx.author.mention} your slots results:
 > {_1} {e} {e}"""
         )
         await ctx.release(1.5)
-        _2 = random.choice(CHOICE)
+        _2 = choice(CHOICE)
         await msg.edit(
             content=f"""{ctx.author.mention} your slots results:
 > {_1} {_2} {e}"""
         )
         await ctx.release(1.5)
-        _3 = random.choice(CHOICE)
+        _3 = choice(CHOICE)
         await msg.edit(
             content=f"""{ctx.author.mention} your slots results:
 > {_1} {_2} {_3}"""
@@ -2203,7 +2302,8 @@ class Fun(Cog):
             await ctx.send(f"{ctx.author.mention} Could not get user info.")
             return
 
-        image_bytes = await user.display_avatar.replace(size=1024).read()
+        avatar = user.display_avatar
+        image_bytes = await avatar.replace(size=1024).read()
         file_name = file_safe_name("eightbit_avatar", ctx.author.display_name)
 
         file = await in_executor(
@@ -2221,7 +2321,7 @@ class Fun(Cog):
         embed.set_image(url=f"attachment://{file_name}")
         embed.set_footer(
             text=f"Made by {ctx.author.display_name}.",
-            icon_url=user.display_avatar.url,
+            icon_url=avatar.url,
         )
 
         await ctx.send(embed=embed, file=file)
@@ -2244,7 +2344,8 @@ class Fun(Cog):
                 await ctx.send(f"{ctx.author.mention} Could not get user info.")
                 return
 
-            image_bytes = await user.display_avatar.replace(size=1024).read()
+            avatar = user.display_avatar
+            image_bytes = await avatar.replace(size=1024).read()
             filename = file_safe_name("reverse_avatar", ctx.author.display_name)
 
             file = await in_executor(
@@ -2259,7 +2360,7 @@ class Fun(Cog):
             embed.set_image(url=f"attachment://{filename}")
             embed.set_footer(
                 text=f"Made by {ctx.author.display_name}.",
-                icon_url=user.display_avatar.url,
+                icon_url=avatar.url,
             )
 
             await ctx.send(embed=embed, file=file)
@@ -2301,7 +2402,8 @@ class Fun(Cog):
                     return
                 ctx.send = send_message  # Reassigns ctx.send
 
-            image_bytes = await user.display_avatar.replace(size=256).read()
+            avatar = user.display_avatar
+            image_bytes = await avatar.replace(size=256).read()
             file_name = file_safe_name("easterified_avatar", ctx.author.display_name)
 
             file = await in_executor(
@@ -2319,7 +2421,7 @@ class Fun(Cog):
             embed.set_image(url=f"attachment://{file_name}")
             embed.set_footer(
                 text=f"Made by {ctx.author.display_name}.",
-                icon_url=user.display_avatar.url,
+                icon_url=avatar.url,
             )
 
         await ctx.send(file=file, embed=embed)
@@ -2477,7 +2579,8 @@ class Fun(Cog):
 
             file_name = file_safe_name("mosaic_avatar", ctx.author.display_name)
 
-            img_bytes = await user.display_avatar.replace(size=1024).read()
+            avatar = user.display_avatar
+            img_bytes = await avatar.replace(size=1024).read()
 
             file = await in_executor(
                 PfpEffects.apply_effect,
@@ -2502,7 +2605,7 @@ class Fun(Cog):
             embed.set_image(url=f"attachment://{file_name}")
             embed.set_footer(
                 text=f"Made by {ctx.author.display_name}",
-                icon_url=user.display_avatar.url,
+                icon_url=avatar.url,
             )
 
             await ctx.send(file=file, embed=embed)
@@ -2696,7 +2799,7 @@ class Fun(Cog):
         except asyncio.TimeoutError:
             return await ctx.message.add_reaction("\N{ALARM CLOCK}")
 
-        line = random.choice(_random_sentences)
+        line = choice(_random_sentences)
         main = "\u200b".join(line)
         await ctx.send(
             f"{ctx.author.mention} typing test started. Type the following phrase: ```ini\n[{main}]```"
@@ -2749,7 +2852,7 @@ class Fun(Cog):
     async def reaction_test(self, ctx: Context):
         """Reaction test, REACT AS FAST AS POSSIBLE"""
         EMOJIS: List[Emoji] = random.sample(EMOJI_DB, 5)
-        emoji = random.choice(EMOJIS)
+        emoji = choice(EMOJIS)
         confirm: discord.Message = await ctx.send(
             f"{ctx.author.mention} click on \N{WHITE HEAVY CHECK MARK} to start."
         )
@@ -2849,7 +2952,6 @@ class Fun(Cog):
             self.bot.add_command(callback)
 
     def some_random_api_loader(self):
-        bot: Parrot = self.bot
         for endpoint in [
             "gay",
             "glass",
@@ -2864,17 +2966,16 @@ class Fun(Cog):
             @commands.command(name=endpoint)
             @commands.bot_has_permissions(attach_files=True, embed_links=True)
             @commands.max_concurrency(1, per=commands.BucketType.user)
+            @commands.cooldown(1, 3, commands.BucketType.user)
             @Context.with_type
             async def callback(ctx: Context, *, member: discord.Member = None) -> None:
                 member = member or ctx.author
 
-                response = await bot.http_session.get(
-                    "https://some-random-api.ml/canvas/{}?avatar={}".format(
-                        ctx.command.name, member.display_avatar.url
-                    )
+                await self._proxy_image(
+                    ctx,
+                    _canvas(ctx.command.name, avatar=member.display_avatar.url),
+                    f"{ctx.command.name}.png",
+                    semaphore=self._srapi_sem,
                 )
-                imageData = io.BytesIO(await response.read())  # read the image/bytes
-
-                await ctx.reply(file=discord.File(imageData, "gay.png"))  # replying the file
 
             self.bot.add_command(callback)
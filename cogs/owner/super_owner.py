@@ -115,16 +115,15 @@ class Owner(Cog, command_attrs=dict(hidden=True)):
     @Context.with_type
     async def gitload(self, ctx: Context, *, link: str):
         """To load the cog extension from github"""
-        r = await self.bot.http_session.get(link)
-        data = await r.read()
         name = f"temp/temp{self.count}"
         name_cog = f"temp.temp{self.count}"
         try:
-            async with async_open(f"{name}.py", "wb") as f:
-                await f.write(data)
-        except Exception as e:
-            tb = traceback.format_exception(type(e), e, e.__traceback__)
-            tbe = "".join(tb) + ""
+            async with self.bot.http_session.get(link) as r:
+                async with async_open(f"{name}.py", "wb") as f:
+                    async for chunk in r.content.iter_chunked(1 << 16):
+                        await f.write(chunk)
+        except Exception:
+            tbe = traceback.format_exc()
             await ctx.send(
                 f"[ERROR] Could not create file `{name}.py`: ```py\n{tbe}\n```"
             )
@@ -133,9 +132,8 @@ class Owner(Cog, command_attrs=dict(hidden=True)):
 
         try:
             self.bot.load_extension(f"{name_cog}")
-        except Exception as e:
-            tb = traceback.format_exception(type(e), e, e.__traceback__)
-            tbe = "".join(tb) + ""
+        except Exception:
+            tbe = traceback.format_exc()
             await ctx.send(
                 f"[ERROR] Could not load extension {name_cog}.py: ```py\n{tbe}\n```"
             )
@@ -150,11 +148,13 @@ class Owner(Cog, command_attrs=dict(hidden=True)):
     async def makefile(self, ctx: Context, name: str, *, text: str):
         """To make a file in ./temp/ directly"""
         try:
-            async with async_open(f"{name}", "w+") as f:
+            # write beside the target and swap it in, so a failed write leaves
+            # no truncated file behind
+            async with async_open(f"{name}.tmp", "w+") as f:
                 await f.write(text)
-        except Exception as e:
-            tb = traceback.format_exception(type(e), e, e.__traceback__)
-            tbe = "".join(tb) + ""
+            os.replace(f"{name}.tmp", name)
+        except Exception:
+            tbe = traceback.format_exc()
             await ctx.send(f"[ERROR] Could not create file `{name}`: ```py\n{tbe}\n```")
         else:
             await ctx.send(f"[SUCCESS] File `{name}` created")
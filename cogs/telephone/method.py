@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import random
-import time
-from typing import Any
+from typing import Any, Awaitable, Callable, FrozenSet
 
 import discord
 from core import Context, Parrot
@@ -11,6 +10,8 @@ from discord.ext import commands
 
 cd_mapping = commands.CooldownMapping.from_cooldown(5, 5, commands.BucketType.channel)
 
+_TELEPHONE_CMDS = frozenset({"pickup", "hangup"})
+
 
 async def dial(bot: Parrot, ctx: Context, server: discord.Guild, reverse: bool = False) -> None:
     collection = bot.mongo.parrot_db.telephone
@@ -22,6 +23,8 @@ async def dial(bot: Parrot, ctx: Context, server: discord.Guild, reverse: bool =
         return await ctx.send("Can't make a self call")
     number = server.id
     channel = ctx.channel
+    self_name = ctx.guild.name
+    target_name = server.name
     self_guild = await collection.find_one({"_id": ctx.guild.id})
     if not self_guild:
         return await ctx.send(
@@ -35,7 +38,7 @@ async def dial(bot: Parrot, ctx: Context, server: discord.Guild, reverse: bool =
 
     if target_guild.get("is_line_busy"):
         return await ctx.send(
-            f"Can not make a connection to **{number} ({bot.get_guild(target_guild['_id']).name})**. Line busy!"
+            f"Can not make a connection to **{number} ({target_name})**. Line busy!"
         )
 
     target_channel = bot.get_channel(target_guild.get("channel"))
@@ -52,112 +55,155 @@ async def dial(bot: Parrot, ctx: Context, server: discord.Guild, reverse: bool =
         )
 
     await ctx.send(
-        f"Calling to **{number} ({bot.get_guild(target_guild['_id']).name})** ... Waiting for the response ..."
+        f"Calling to **{number} ({target_name})** ... Waiting for the response ..."
     )
 
+    queue: asyncio.Queue[discord.Message] = asyncio.Queue()
+
+    async def relay(
+        m: discord.Message,
+        _channel_ids: FrozenSet[int] = frozenset({target_channel.id, channel.id}),
+        _put: Callable[[discord.Message], None] = queue.put_nowait,
+    ) -> None:
+        if m.channel.id in _channel_ids and not m.author.bot:
+            _put(m)
+
+    bot.add_listener(relay, "on_message")
+    try:
+        await _call(
+            ctx,
+            queue,
+            channel,
+            target_channel,
+            target_guild,
+            telephone_update,
+            self_name=self_name,
+            target_name=target_name,
+            reverse=reverse,
+        )
+    finally:
+        bot.remove_listener(relay, "on_message")
+
+
+async def _call(
+    ctx: Context,
+    queue: asyncio.Queue[discord.Message],
+    channel: discord.abc.Messageable,
+    target_channel: discord.abc.Messageable,
+    target_guild: dict,
+    telephone_update: Callable[[int, str, Any], Awaitable[None]],
+    *,
+    self_name: str,
+    target_name: str,
+    reverse: bool,
+) -> None:
+    number = target_guild["_id"]
+
     await target_channel.send(
-        f"**Incoming call from {ctx.guild.id}. {ctx.guild.name} ...**\n`pickup` to pickup | `hangup` to reject"
+        f"**Incoming call from {ctx.guild.id}. {self_name} ...**\n`pickup` to pickup | `hangup` to reject"
     )
-    try:
-        temp_message = target_channel.send(
-            f'<@&{target_guild["pingrole"]}> <@{target_guild["memberping"]}>',
+    mentions = []
+    if role_id := target_guild.get("pingrole"):
+        mentions.append(f"<@&{role_id}>")
+    if member_id := target_guild.get("memberping"):
+        mentions.append(f"<@{member_id}>")
+    if mentions:
+        await target_channel.send(
+            " ".join(mentions),
             delete_after=1,
-        )
-        await temp_message.delete(delay=0)
-    except (AttributeError, KeyError):
-        pass
-
-    def check_pickup_hangup(m):
-        return (
-            (m.content.lower() in ("pickup", "hangup"))
-            and (m.channel in (channel, target_channel))
-            and (not m.author.bot)
+            allowed_mentions=discord.AllowedMentions(roles=True, users=True),
         )
 
+    loop = asyncio.get_running_loop()
+    ring_deadline = loop.time() + 60
     try:
-        _talk = await bot.wait_for("message", check=check_pickup_hangup, timeout=60)
+        while True:
+            # chatter must not extend the 60 seconds the line rings for
+            _talk = await asyncio.wait_for(
+                queue.get(), timeout=ring_deadline - loop.time()
+            )
+            content = _talk.content
+            # `pickup` and `hangup` are both six characters
+            if len(content) == 6 and (command := content.lower()) in _TELEPHONE_CMDS:
+                break
     except asyncio.TimeoutError:
         await asyncio.sleep(0.5)
-        await target_channel.send(
-            f"Line disconnected from **{ctx.guild.id} ({ctx.guild.name})**. Reason: Line Inactive for more than 60 seconds"
+        await asyncio.gather(
+            target_channel.send(
+                f"Line disconnected from **{ctx.guild.id} ({self_name})**. Reason: Line Inactive for more than 60 seconds"
+            ),
+            ctx.send(
+                f"Line disconnected from **{number} ({target_name})**. Reason: Line Inactive for more than 60 seconds"
+            ),
         )
-        await ctx.send(
-            f"Line disconnected from **{number} ({bot.get_guild(number).name})**. Reason: Line Inactive for more than 60 seconds"
-        )
-
-        await telephone_update(ctx.guild.id, "is_line_busy", False)
-        await telephone_update(number, "is_line_busy", False)
         return
 
-    if _talk.content.lower() == "hangup":
-        await ctx.send(
-            f"Disconnected. From **{_talk.author.guild.name} ({_talk.author.guild.id})**"
-        )
-        await target_channel.send(
-            f"Disconnected. From **{_talk.author.guild.name} ({_talk.author.guild.id})**"
-        )
-        await telephone_update(ctx.guild.id, "is_line_busy", False)
-        await telephone_update(number, "is_line_busy", False)
+    if command == "hangup":
+        disconnected = f"Disconnected. From **{_talk.author.guild.name} ({_talk.author.guild.id})**"
+        await asyncio.gather(ctx.send(disconnected), target_channel.send(disconnected))
         return
 
-    if _talk.content.lower() == "pickup":
-        await ctx.send(f"**Connected. Say {random.choice(['hi', 'hello', 'heya'])}**")
-        await target_channel.send(f"**Connected. Say {random.choice(['hi', 'hello', 'heya'])}**")
+    await asyncio.gather(
+        ctx.send(f"**Connected. Say {random.choice(['hi', 'hello', 'heya'])}**"),
+        target_channel.send(f"**Connected. Say {random.choice(['hi', 'hello', 'heya'])}**"),
+    )
 
-        await telephone_update(ctx.guild.id, "is_line_busy", True)
-        await telephone_update(number, "is_line_busy", True)
-        ini = time.time() + 120
+    await asyncio.gather(
+        telephone_update(ctx.guild.id, "is_line_busy", True),
+        telephone_update(number, "is_line_busy", True),
+    )
+    try:
+        deadline = loop.time() + 120
         while True:
-
-            def check_in_channel(m: discord.Message) -> bool:
-                if m.author.bot:
-                    return False
-                return m.channel in (target_channel, channel)
-
             try:
-                talk_message = await bot.wait_for("message", check=check_in_channel, timeout=60.0)
+                # a non-positive timeout times out straight away
+                talk_message = await asyncio.wait_for(
+                    queue.get(), timeout=min(deadline - loop.time(), 60.0)
+                )
             except asyncio.TimeoutError:
+                if loop.time() >= deadline:
+                    await asyncio.gather(
+                        channel.send("Disconnected. Call duration reached its maximum limit"),
+                        target_channel.send("Disconnected. Call duration reached its maximum limit"),
+                    )
+                    return
                 await asyncio.sleep(0.5)
-                await target_channel.send(
-                    f"Line disconnected from **{ctx.guild.id} ({ctx.guild.name})**. Reason: Line Inactive for more than 60 seconds"
-                )
-                await ctx.send(
-                    f"Line disconnected from **{number} ({bot.get_guild(number).name})**. Reason: Line Inactive for more than 60 seconds"
+                await asyncio.gather(
+                    target_channel.send(
+                        f"Line disconnected from **{ctx.guild.id} ({self_name})**. Reason: Line Inactive for more than 60 seconds"
+                    ),
+                    ctx.send(
+                        f"Line disconnected from **{number} ({target_name})**. Reason: Line Inactive for more than 60 seconds"
+                    ),
                 )
-
-                await telephone_update(ctx.guild.id, "is_line_busy", False)
-                await telephone_update(number, "is_line_busy", False)
                 return
 
             bucket = cd_mapping.get_bucket(talk_message)
             retry_after = bucket.update_rate_limit()
             if retry_after:
-                await telephone_update(ctx.guild.id, "is_line_busy", False)
-                await telephone_update(number, "is_line_busy", False)
-                await target_channel.send("Disconnect due to channel spam")
-                await ctx.send("Disconnect due to channel spam")
+                await asyncio.gather(
+                    target_channel.send("Disconnect due to channel spam"),
+                    ctx.send("Disconnect due to channel spam"),
+                )
                 return
 
-            if talk_message.content.lower() == "hangup":
-                await telephone_update(ctx.guild.id, "is_line_busy", False)
-                await telephone_update(number, "is_line_busy", False)
-                await ctx.send("Disconnected")
-                await target_channel.send("Disconnected")
+            content = talk_message.content
+            if len(content) == 6 and content.lower() == "hangup":
+                await asyncio.gather(ctx.send("Disconnected"), target_channel.send("Disconnected"))
                 return
-            TALK = discord.utils.escape_mentions(talk_message.content[:1000:])
+            content = content[:1000]
             if reverse:
-                TALK = discord.utils.escape_mentions(
-                    "".join(reversed(talk_message.content[:1000:]))
-                )  # this is imp, cause people can bypass so i added discord.utils
+                content = content[::-1]
+            # this is imp, cause people can bypass so i added discord.utils
+            TALK = discord.utils.escape_mentions(content)
 
-            if talk_message.channel == target_channel:
+            if talk_message.channel.id == target_channel.id:
                 await channel.send(f"**{talk_message.author}** {TALK}")
 
-            elif talk_message.channel == channel:
+            elif talk_message.channel.id == channel.id:
                 await target_channel.send(f"**{talk_message.author}** {TALK}")
-            if ini - time.time() <= 60:
-                await channel.send("Disconnected. Call duration reached its maximum limit")
-                await target_channel.send("Disconnected. Call duration reached its maximum limit")
-                await telephone_update(ctx.guild.id, "is_line_busy", False)
-                await telephone_update(number, "is_line_busy", False)
-                return
+    finally:
+        await asyncio.gather(
+            telephone_update(ctx.guild.id, "is_line_busy", False),
+            telephone_update(number, "is_line_busy", False),
+        )
@@ -2,13 +2,18 @@ from __future__ import annotations
 
 import asyncio
 import random
+import weakref
 from time import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Counter, Dict, List, Optional, Tuple
 
 import discord
 from core import Context, Parrot
 from discord.ext import commands
+from lru import LRU
+from pymongo import ReturnDocument, UpdateOne
 from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
+from utilities.counter import flush_counter
 from utilities.exceptions import ParrotCheckFailure, ParrotTimeoutError
 from utilities.paginator import ParrotPaginator
 from utilities.time import ShortTime
@@ -32,14 +37,168 @@ IGNORE = [
     "give",
     "transfer",
     "raw",
+    "migrate",
 ]
 
 
+# collection full name -> index build task; create_index is idempotent, so an
+# evicted entry only means the build runs again
+_INDEX_TASKS: Dict[str, asyncio.Task] = LRU(1024)  # type: ignore
+
+_TAG_INDEXES: Tuple[Any, ...] = (
+    [("guild_id", 1), ("id", 1)],
+    [("guild_id", 1), ("id", 1), ("owner", 1)],
+    [("guild_id", 1), ("owner", 1)],
+)
+
+
+async def _create_indexes(collection: Collection, unique: Any, *keys: Any) -> bool:
+    try:
+        await collection.create_index(unique, unique=True)
+        for key in keys:
+            await collection.create_index(key)
+    except OperationFailure:
+        # legacy collections may already hold duplicate names; lookups still
+        # work, they just stay unindexed until cleaned up
+        return False
+    return True
+
+
+def _index_task(collection: Collection, unique: Any, *keys: Any) -> asyncio.Task:
+    try:
+        return _INDEX_TASKS[collection.full_name]
+    except KeyError:
+        task = asyncio.create_task(_create_indexes(collection, unique, *keys))
+        _INDEX_TASKS[collection.full_name] = task
+        return task
+
+
+def _indexed(collection: Collection, unique: Any, *keys: Any) -> Collection:
+    _index_task(collection, unique, *keys)
+    return collection
+
+
+def _shared_tags(bot: Parrot) -> Collection:
+    return _indexed(bot.mongo.parrot_db["tags"], *_TAG_INDEXES)
+
+
+# guild id -> whether its legacy tag collection is gone; guilds whose legacy
+# collection had to be kept are only retried by `tag migrate`
+_MIGRATED_GUILDS: Dict[int, bool] = {}
+_MIGRATION_LOCKS: weakref.WeakValueDictionary[int, asyncio.Lock] = (
+    weakref.WeakValueDictionary()
+)
+
+
+async def _migrate_guild_tags(bot: Parrot, guild_id: int) -> bool:
+    """Move a guild's tags from the legacy `tags` database into parrot_db.tags.
+
+    Returns True once no legacy collection is left for the guild.
+    """
+    legacy = bot.mongo.tags[str(guild_id)]
+    docs = await legacy.find({}).to_list(length=None)
+    if not docs:
+        return True
+
+    collection = _shared_tags(bot)
+    # the unique {guild_id, id} index must exist before inserting
+    if not await _index_task(collection, *_TAG_INDEXES):
+        return False
+    for doc in docs:
+        doc["guild_id"] = guild_id
+    try:
+        await collection.insert_many(docs, ordered=False)
+    except BulkWriteError as e:
+        # 11000: the name (or, on a re-run, the legacy _id) is already taken
+        if e.details.get("writeConcernErrors") or any(
+            err.get("code") != 11000 for err in e.details.get("writeErrors", [])
+        ):
+            return False
+
+    # documents keep their legacy _id, so a name held by anything else is a
+    # collision with a tag created since the switch; keep the legacy copy then
+    legacy_ids = {doc["_id"] for doc in docs}
+    names = {doc["id"] for doc in docs}
+    held = await collection.find(
+        {"guild_id": guild_id, "id": {"$in": list(names)}}, {"id": 1}
+    ).to_list(length=None)
+    if {doc["id"] for doc in held if doc["_id"] in legacy_ids} != names:
+        return False
+    await legacy.drop()
+    return True
+
+
+async def _run_guild_migration(
+    bot: Parrot, guild_id: int, *, force: bool = False
+) -> bool:
+    lock = _MIGRATION_LOCKS.get(guild_id)
+    if lock is None:
+        lock = _MIGRATION_LOCKS[guild_id] = asyncio.Lock()
+    async with lock:
+        if force or guild_id not in _MIGRATED_GUILDS:
+            _MIGRATED_GUILDS[guild_id] = await _migrate_guild_tags(bot, guild_id)
+        return _MIGRATED_GUILDS[guild_id]
+
+
+async def _tag_collection(bot: Parrot, guild_id: int) -> Collection:
+    # a guild's legacy tags are moved over before its first read
+    if guild_id not in _MIGRATED_GUILDS:
+        await _run_guild_migration(bot, guild_id)
+    return _shared_tags(bot)
+
+
+async def _migrate_legacy_tags(bot: Parrot, ctx: Context) -> None:
+    migrated: List[str] = []
+    kept: List[str] = []
+    for name in await bot.mongo.tags.list_collection_names():
+        if not name.isdigit():
+            continue
+        if await _run_guild_migration(bot, int(name), force=True):
+            migrated.append(name)
+        else:
+            kept.append(name)
+
+    msg = f"{ctx.author.mention} migrated tags of **{len(migrated)}** guild(s)"
+    if kept:
+        msg += (
+            f", kept **{len(kept)}** legacy collection(s) with colliding or "
+            f"unwritable tags: `{'`, `'.join(kept)}`"
+        )
+    await ctx.reply(msg[:2000])
+
+
+def _todo_collection(bot: Parrot, author_id: int) -> Collection:
+    return bot.mongo.todo[f"{author_id}"]
+
+
+# (guild_id, tag) -> uses not yet written back; drained by Utils.tag_uses_flusher
+_TAG_USES: Counter[Tuple[int, str]] = Counter()
+
+
+async def _flush_tag_uses(bot: Parrot) -> None:
+    await flush_counter(
+        _TAG_USES,
+        _shared_tags(bot),
+        lambda key, count: UpdateOne(
+            {"guild_id": key[0], "id": key[1]}, {"$inc": {"count": count}}
+        ),
+    )
+
+
+async def _not_owned_or_missing(ctx: Context, collection: Collection, tag: str) -> None:
+    # only reached when an owner-filtered write matched nothing
+    if await collection.find_one({"guild_id": ctx.guild.id, "id": tag}, {"_id": 1}):
+        await ctx.reply(f"{ctx.author.mention} you don't own this tag")
+    else:
+        await ctx.reply(f"{ctx.author.mention} No tag with named `{tag}`")
+
+
 async def _show_tag(
     bot: Parrot, ctx: Context, tag: str, msg_ref: discord.Message = None
 ):
-    collection: Collection = bot.mongo.tags[f"{ctx.guild.id}"]
-    if data := await collection.find_one({"id": tag}):
+    collection: Collection = await _tag_collection(bot, ctx.guild.id)
+    if data := await collection.find_one({"guild_id": ctx.guild.id, "id": tag}):
+        _TAG_USES[(ctx.guild.id, tag)] += 1
         if not data["nsfw"]:
             if msg_ref is not None:
                 await msg_ref.reply(data["text"])
@@ -57,12 +216,11 @@ async def _show_tag(
                 )
     else:
         await ctx.reply(f"{ctx.author.mention} No tag with named `{tag}`")
-    await collection.update_one({"id": tag}, {"$inc": {"count": 1}})
 
 
 async def _show_raw_tag(bot: Parrot, ctx: Context, tag: str):
-    collection: Collection = bot.mongo.tags[f"{ctx.guild.id}"]
-    if data := await collection.find_one({"_id": tag}):
+    collection: Collection = await _tag_collection(bot, ctx.guild.id)
+    if data := await collection.find_one({"guild_id": ctx.guild.id, "id": tag}):
         first = discord.utils.escape_markdown(data["text"])
         main = discord.utils.escape_mentions(first)
         if not data["nsfw"]:
@@ -79,12 +237,12 @@ async def _show_raw_tag(bot: Parrot, ctx: Context, tag: str):
 
 
 async def _create_tag(bot: Parrot, ctx: Context, tag: str, text: str):
-    collection: Collection = bot.mongo.tags[f"{ctx.guild.id}"]
+    collection: Collection = await _tag_collection(bot, ctx.guild.id)
     if tag in IGNORE:
         return await ctx.reply(
             f"{ctx.author.mention} the name `{tag}` is reserved word."
         )
-    if _ := await collection.find_one({"id": tag}):
+    if _ := await collection.find_one({"guild_id": ctx.guild.id, "id": tag}):
         return await ctx.reply(f"{ctx.author.mention} the name `{tag}` already exists")
 
     val = await ctx.prompt(
@@ -95,76 +253,85 @@ async def _create_tag(bot: Parrot, ctx: Context, tag: str, text: str):
             f"{ctx.author.mention} you did not responds on time. Considering as non NSFW"
         )
     nsfw = bool(val)
-    await collection.insert_one(
-        {
-            "id": tag,
-            "text": text,
-            "count": 0,
-            "owner": ctx.author.id,
-            "nsfw": nsfw,
-            "created_at": int(time()),
-        }
-    )
+    try:
+        await collection.insert_one(
+            {
+                "guild_id": ctx.guild.id,
+                "id": tag,
+                "text": text,
+                "count": 0,
+                "owner": ctx.author.id,
+                "nsfw": nsfw,
+                "created_at": int(time()),
+            }
+        )
+    except DuplicateKeyError:
+        # taken while the prompt was open
+        return await ctx.reply(f"{ctx.author.mention} the name `{tag}` already exists")
     await ctx.reply(f"{ctx.author.mention} tag created successfully")
 
 
 async def _delete_tag(bot: Parrot, ctx: Context, tag: str):
-    collection: Collection = bot.mongo.tags[f"{ctx.guild.id}"]
-    if data := await collection.find_one({"id": tag}):
-        if data["owner"] == ctx.author.id:
-            await collection.delete_one({"id": tag})
-            await ctx.reply(f"{ctx.author.mention} tag deleted successfully")
-        else:
-            await ctx.reply(f"{ctx.author.mention} you don't own this tag")
+    collection: Collection = await _tag_collection(bot, ctx.guild.id)
+    if await collection.find_one_and_delete(
+        {"guild_id": ctx.guild.id, "id": tag, "owner": ctx.author.id}
+    ):
+        await ctx.reply(f"{ctx.author.mention} tag deleted successfully")
     else:
-        await ctx.reply(f"{ctx.author.mention} No tag with named `{tag}`")
+        await _not_owned_or_missing(ctx, collection, tag)
 
 
 async def _name_edit(bot: Parrot, ctx: Context, tag: str, name: str):
-    collection: Collection = bot.mongo.tags[f"{ctx.guild.id}"]
-    if _ := await collection.find_one({"id": name}):
-        await ctx.reply(
+    collection: Collection = await _tag_collection(bot, ctx.guild.id)
+    if _ := await collection.find_one({"guild_id": ctx.guild.id, "id": name}):
+        return await ctx.reply(
             f"{ctx.author.mention} that name already exists in the database"
         )
-    elif data := await collection.find_one({"id": tag}):
-        if data["owner"] == ctx.author.id:
-            await collection.update_one({"id": tag}, {"$set": {"id": name}})
-            await ctx.reply(f"{ctx.author.mention} tag name successfully changed")
-        else:
-            await ctx.reply(f"{ctx.author.mention} you don't own this tag")
+    try:
+        updated = await collection.find_one_and_update(
+            {"guild_id": ctx.guild.id, "id": tag, "owner": ctx.author.id},
+            {"$set": {"id": name}},
+        )
+    except DuplicateKeyError:
+        return await ctx.reply(
+            f"{ctx.author.mention} that name already exists in the database"
+        )
+    if updated:
+        await ctx.reply(f"{ctx.author.mention} tag name successfully changed")
     else:
-        await ctx.reply(f"{ctx.author.mention} No tag with named `{tag}`")
+        await _not_owned_or_missing(ctx, collection, tag)
 
 
 async def _text_edit(bot: Parrot, ctx: Context, tag: str, text: str):
-    collection: Collection = bot.mongo.tags[f"{ctx.guild.id}"]
-    if data := await collection.find_one({"id": tag}):
-        if data["owner"] == ctx.author.id:
-            await collection.update_one({"id": tag}, {"$set": {"text": text}})
-            await ctx.reply(f"{ctx.author.mention} tag content successfully changed")
-        else:
-            await ctx.reply(f"{ctx.author.mention} you don't own this tag")
+    collection: Collection = await _tag_collection(bot, ctx.guild.id)
+    if await collection.find_one_and_update(
+        {"guild_id": ctx.guild.id, "id": tag, "owner": ctx.author.id},
+        {"$set": {"text": text}},
+    ):
+        await ctx.reply(f"{ctx.author.mention} tag content successfully changed")
     else:
-        await ctx.reply(f"{ctx.author.mention} No tag with named `{tag}`")
+        await _not_owned_or_missing(ctx, collection, tag)
 
 
 async def _claim_owner(bot: Parrot, ctx: Context, tag: str):
-    collection: Collection = bot.mongo.tags[f"{ctx.guild.id}"]
-    if data := await collection.find_one({"id": tag}):
+    collection: Collection = await _tag_collection(bot, ctx.guild.id)
+    if data := await collection.find_one({"guild_id": ctx.guild.id, "id": tag}):
         member = await bot.get_or_fetch_member(ctx.guild, data["owner"])
         if member:
             return await ctx.reply(
                 f"{ctx.author.mention} you can not claim the tag ownership as the member is still in the server"
             )
-        await collection.update_one({"id": tag}, {"$set": {"owner": ctx.author.id}})
+        await collection.update_one(
+            {"guild_id": ctx.guild.id, "id": tag}, {"$set": {"owner": ctx.author.id}}
+        )
         await ctx.reply(f"{ctx.author.mention} ownership of tag `{tag}` claimed!")
     else:
         await ctx.reply(f"{ctx.author.mention} No tag with named `{tag}`")
 
 
 async def _transfer_owner(bot: Parrot, ctx: Context, tag: str, member: discord.Member):
-    collection: Collection = bot.mongo.tags[f"{ctx.guild.id}"]
-    if data := await collection.find_one({"id": tag}):
+    collection: Collection = await _tag_collection(bot, ctx.guild.id)
+    if data := await collection.find_one({"guild_id": ctx.guild.id, "id": tag}):
         if data["owner"] != ctx.author.id:
             return await ctx.reply(f"{ctx.author.mention} you don't own this tag")
         val = await ctx.prompt(
@@ -173,7 +340,9 @@ async def _transfer_owner(bot: Parrot, ctx: Context, tag: str, member: discord.M
         if val is None:
             await ctx.reply(f"{ctx.author.mention} you did not responds on time")
         elif val:
-            await collection.update_one({"id": tag}, {"$set": {"owner": member.id}})
+            await collection.update_one(
+                {"guild_id": ctx.guild.id, "id": tag}, {"$set": {"owner": member.id}}
+            )
             await ctx.reply(
                 f"{ctx.author.mention} tag ownership successfully transfered to **{member}**"
             )
@@ -184,26 +353,27 @@ async def _transfer_owner(bot: Parrot, ctx: Context, tag: str, member: discord.M
 
 
 async def _toggle_nsfw(bot: Parrot, ctx: Context, tag: str):
-    collection: Collection = bot.mongo.tags[f"{ctx.guild.id}"]
-    if data := await collection.find_one({"id": tag}):
-        if data["owner"] != ctx.author.id:
-            return await ctx.reply(f"{ctx.author.mention} you don't own this tag")
-        nsfw = not data["nsfw"]
-        await collection.update_one({"id": tag}, {"$set": {"nsfw": nsfw}})
+    collection: Collection = await _tag_collection(bot, ctx.guild.id)
+    if data := await collection.find_one_and_update(
+        {"guild_id": ctx.guild.id, "id": tag, "owner": ctx.author.id},
+        [{"$set": {"nsfw": {"$not": "$nsfw"}}}],
+        return_document=ReturnDocument.AFTER,
+    ):
         await ctx.reply(
-            f"{ctx.author.mention} NSFW status of tag named `{tag}` is set to **{nsfw}**"
+            f"{ctx.author.mention} NSFW status of tag named `{tag}` is set to **{data['nsfw']}**"
         )
     else:
-        await ctx.reply(f"{ctx.author.mention} No tag with named `{tag}`")
+        await _not_owned_or_missing(ctx, collection, tag)
 
 
 async def _show_tag_mine(bot: Parrot, ctx: Context):
-    collection: Collection = bot.mongo.tags[f"{ctx.guild.id}"]
-    i = 1
+    collection: Collection = await _tag_collection(bot, ctx.guild.id)
     paginator = ParrotPaginator(ctx, title="Tags")
-    async for data in collection.find({"owner": ctx.author.id}):
-        paginator.add_line(f"`{i}` {data['_id']}")
-        i += 1
+    docs = await collection.find(
+        {"guild_id": ctx.guild.id, "owner": ctx.author.id}, {"id": 1, "_id": 0}
+    ).to_list(length=None)
+    for i, data in enumerate(docs, 1):
+        paginator.add_line(f"`{i}` {data['id']}")
     try:
         await paginator.start()
     except IndexError:
@@ -213,12 +383,13 @@ async def _show_tag_mine(bot: Parrot, ctx: Context):
 
 
 async def _show_all_tags(bot: Parrot, ctx: Context):
-    collection: Collection = bot.mongo.tags[f"{ctx.guild.id}"]
-    i = 1
+    collection: Collection = await _tag_collection(bot, ctx.guild.id)
     paginator = ParrotPaginator(ctx, title="Tags", per_page=12)
-    async for data in collection.find({}):
+    docs = await collection.find(
+        {"guild_id": ctx.guild.id}, {"id": 1, "_id": 0}
+    ).to_list(length=None)
+    for i, data in enumerate(docs, 1):
         paginator.add_line(f"`{i}` {data['id']}")
-        i += 1
     try:
         await paginator.start()
     except IndexError:
@@ -226,10 +397,20 @@ async def _show_all_tags(bot: Parrot, ctx: Context):
 
 
 async def _view_tag(bot: Parrot, ctx: Context, tag: str):
-    collection = bot.mongo.tags[f"{ctx.guild.id}"]
-    if data := await collection.find_one({"id": tag}):
-        text_len = len(data["text"])
+    collection: Collection = await _tag_collection(bot, ctx.guild.id)
+    if data := await collection.find_one(
+        {"guild_id": ctx.guild.id, "id": tag},
+        {
+            "owner": 1,
+            "nsfw": 1,
+            "count": 1,
+            "created_at": 1,
+            "text_len": {"$strLenCP": "$text"},
+        },
+    ):
+        text_len = data["text_len"]
         owner = await bot.get_or_fetch_member(ctx.guild, data["owner"])
+        mention = owner.mention if owner else None
         nsfw = data["nsfw"]
         count = data["count"]
         created_at = f"<t:{data['created_at']}>"
@@ -240,7 +421,7 @@ async def _view_tag(bot: Parrot, ctx: Context, tag: str):
                 timestamp=discord.utils.utcnow(),
                 color=ctx.author.color,
             )
-            .add_field(name="Owner", value=f"**{owner.mention if owner else None}**")
+            .add_field(name="Owner", value=f"**{mention}**")
             .add_field(name="Created At?", value=created_at)
             .add_field(name="Text Length", value=str(text_len))
             .add_field(name="Is NSFW?", value=nsfw)
@@ -252,26 +433,32 @@ async def _view_tag(bot: Parrot, ctx: Context, tag: str):
 
 
 async def _create_todo(bot: Parrot, ctx: Context, name: str, text: str):
-    collection: Collection = bot.mongo.todo[f"{ctx.author.id}"]
+    # only the write path indexes, reads must not create the collection
+    collection: Collection = _indexed(_todo_collection(bot, ctx.author.id), "id")
     if data := await collection.find_one({"id": name}):
         await ctx.reply(
             f"{ctx.author.mention} `{name}` already exists as your TODO list"
         )
     else:
-        await collection.insert_one(
-            {
-                "id": name,
-                "text": text,
-                "time": int(time()),
-                "deadline": None,
-                "msglink": ctx.message.jump_url,
-            }
-        )
+        try:
+            await collection.insert_one(
+                {
+                    "id": name,
+                    "text": text,
+                    "time": int(time()),
+                    "deadline": None,
+                    "msglink": ctx.message.jump_url,
+                }
+            )
+        except DuplicateKeyError:
+            return await ctx.reply(
+                f"{ctx.author.mention} `{name}` already exists as your TODO list"
+            )
         await ctx.reply(f"{ctx.author.mention} created as your TODO list")
 
 
 async def _set_timer_todo(bot: Parrot, ctx: Context, name: str, timestamp: float):
-    collection: Collection = bot.mongo.todo[f"{ctx.author.id}"]
+    collection: Collection = _todo_collection(bot, ctx.author.id)
     if _ := await collection.find_one({"id": name}):
         post = {"deadline": timestamp}
         try:
@@ -299,17 +486,17 @@ async def _set_timer_todo(bot: Parrot, ctx: Context, name: str, timestamp: float
 
 
 async def _update_todo_name(bot: Parrot, ctx: Context, name: str, new_name: str):
-    collection: Collection = bot.mongo.todo[f"{ctx.author.id}"]
-    if _ := await collection.find_one({"id": name}):
-        if _ := await collection.find_one({"id": new_name}):
-            await ctx.reply(
-                f"{ctx.author.mention} `{new_name}` already exists as your TODO list"
-            )
-        else:
-            await collection.update_one({"id": name}, {"$set": {"id": new_name}})
-            await ctx.reply(
-                f"{ctx.author.mention} name changed from `{name}` to `{new_name}`"
-            )
+    collection: Collection = _todo_collection(bot, ctx.author.id)
+    if _ := await collection.find_one({"id": new_name}, {"_id": 1}):
+        await ctx.reply(
+            f"{ctx.author.mention} `{new_name}` already exists as your TODO list"
+        )
+        return
+    result = await collection.update_one({"id": name}, {"$set": {"id": new_name}})
+    if result.matched_count:
+        await ctx.reply(
+            f"{ctx.author.mention} name changed from `{name}` to `{new_name}`"
+        )
     else:
         await ctx.reply(
             f"{ctx.author.mention} you don't have any TODO list with name `{name}`"
@@ -317,9 +504,9 @@ async def _update_todo_name(bot: Parrot, ctx: Context, name: str, new_name: str)
 
 
 async def _update_todo_text(bot: Parrot, ctx: Context, name: str, text: str):
-    collection: Collection = bot.mongo.todo[f"{ctx.author.id}"]
-    if _ := await collection.find_one({"id": name}):
-        await collection.update_one({"id": name}, {"$set": {"text": text}})
+    collection: Collection = _todo_collection(bot, ctx.author.id)
+    result = await collection.update_one({"id": name}, {"$set": {"text": text}})
+    if result.matched_count:
         await ctx.reply(
             f"{ctx.author.mention} TODO list of name `{name}` has been updated"
         )
@@ -330,12 +517,13 @@ async def _update_todo_text(bot: Parrot, ctx: Context, name: str, text: str):
 
 
 async def _list_todo(bot: Parrot, ctx: Context):
-    collection: Collection = bot.mongo.todo[f"{ctx.author.id}"]
-    i = 1
+    collection: Collection = _todo_collection(bot, ctx.author.id)
     paginator = ParrotPaginator(ctx, title="Your Pending Tasks", per_page=12)
-    async for data in collection.find({}):
+    docs = await collection.find({}, {"id": 1, "msglink": 1, "_id": 0}).to_list(
+        length=None
+    )
+    for i, data in enumerate(docs, 1):
         paginator.add_line(f"[`{i}`]({data['msglink']}) {data['id']}")
-        i += 1
     try:
         await paginator.start()
     except IndexError:
@@ -343,7 +531,7 @@ async def _list_todo(bot: Parrot, ctx: Context):
 
 
 async def _show_todo(bot: Parrot, ctx: Context, name: str):
-    collection: Collection = bot.mongo.todo[f"{ctx.author.id}"]
+    collection: Collection = _todo_collection(bot, ctx.author.id)
     if data := await collection.find_one({"id": name}):
         await ctx.reply(
             f"> **{data['id']}**\n\nDescription: {data['text']}\n\nCreated At: <t:{data['time']}>"
@@ -355,9 +543,9 @@ async def _show_todo(bot: Parrot, ctx: Context, name: str):
 
 
 async def _delete_todo(bot: Parrot, ctx: Context, name: str):
-    collection: Collection = bot.mongo.todo[f"{ctx.author.id}"]
-    if _ := await collection.find_one({"id": name}):
-        await collection.delete_one({"id": name})
+    collection: Collection = _todo_collection(bot, ctx.author.id)
+    result = await collection.delete_one({"id": name})
+    if result.deleted_count:
         await ctx.reply(f"{ctx.author.mention} delete `{name}` task")
     else:
         await ctx.reply(
@@ -52,6 +52,7 @@ class Utils(Cog):
 
         self.reminder_task.start()
         self.server_stats_updater.start()
+        self.tag_uses_flusher.start()
 
     @property
     def display_emoji(self) -> discord.PartialEmoji:
@@ -306,6 +307,12 @@ class Utils(Cog):
         """To show the tag in raw format"""
         await mt._show_raw_tag(self.bot, ctx, tag)
 
+    @tag.command(name="migrate", hidden=True)
+    @commands.is_owner()
+    async def tag_migrate(self, ctx: Context):
+        """To move the legacy per-guild tag collections into the shared one"""
+        await mt._migrate_legacy_tags(self.bot, ctx)
+
     @commands.command()
     @commands.has_permissions(manage_messages=True, add_reactions=True)
     @commands.bot_has_permissions(
@@ -567,6 +574,8 @@ class Utils(Cog):
     async def cog_unload(self):
         self.reminder_task.cancel()
         self.server_stats_updater.cancel()
+        self.tag_uses_flusher.cancel()
+        await mt._flush_tag_uses(self.bot)
 
     @commands.command(aliases=["level"])
     @commands.bot_has_permissions(attach_files=True)
@@ -1232,3 +1241,7 @@ class Utils(Cog):
     @server_stats_updater.before_loop
     async def before_server_stats_updater(self):
         await self.bot.wait_until_ready()
+
+    @tasks.loop(seconds=0.5)
+    async def tag_uses_flusher(self):
+        await mt._flush_tag_uses(self.bot)
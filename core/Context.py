@@ -5,8 +5,8 @@ from __future__ import annotations
 import asyncio
 import datetime
 import functools
+import inspect
 import io
-import time
 from contextlib import suppress
 from operator import attrgetter
 from typing import (
@@ -14,10 +14,9 @@ from typing import (
     Any,
     Awaitable,
     Callable,
-    Coroutine,
     Dict,
+    FrozenSet,
     Generic,
-    Iterable,
     List,
     Literal,
     Optional,
@@ -28,13 +27,19 @@ from typing import (
 )
 
 import discord
+from async_timeout import timeout as _timeout  # type: ignore
 from discord.ext import commands
+from lru import LRU
 from utilities.emotes import emojis
 
 CONFIRM_REACTIONS: Tuple[str, ...] = (
     "\N{THUMBS UP SIGN}",
     "\N{THUMBS DOWN SIGN}",
 )
+CONFIRM_REACTIONS_SET: FrozenSet[str] = frozenset(CONFIRM_REACTIONS)
+
+_SEND_PERMISSIONS: int = discord.Permissions(send_messages=True).value
+_SEND_EMBED_PERMISSIONS: int = discord.Permissions(send_messages=True, embed_links=True).value
 
 if TYPE_CHECKING:
     from typing_extensions import ParamSpec
@@ -49,6 +54,30 @@ MaybeAwaitable = Union[T, Awaitable[T]]
 Callback = MaybeAwaitable
 BotT = TypeVar("BotT", bound=commands.Bot)
 
+# (channel_id, user_id) pairs already DM'd about missing send/embed permissions
+_missing_perms_warned: Dict[Tuple[int, int], bool] = LRU(1024)  # type: ignore
+
+# guild id -> lowercased role name -> roles; dropped by Parrot's role events
+_role_name_cache: Dict[int, Dict[str, Tuple[discord.Role, ...]]] = LRU(256)  # type: ignore
+
+
+def invalidate_role_name_cache(guild_id: int) -> None:
+    with suppress(KeyError):
+        del _role_name_cache[guild_id]
+
+
+def _roles_named(guild: discord.Guild, name: str) -> Tuple[discord.Role, ...]:
+    """Roles of ``guild`` whose lowercased name is ``name``, lowest first."""
+    try:
+        by_name = _role_name_cache[guild.id]
+    except KeyError:
+        grouped: Dict[str, List[discord.Role]] = {}
+        for role in guild.roles:
+            grouped.setdefault(role.name.lower(), []).append(role)
+        by_name = {k: tuple(v) for k, v in grouped.items()}
+        _role_name_cache[guild.id] = by_name
+    return by_name.get(name, ())
+
 
 class Context(commands.Context["commands.Bot"], Generic[BotT]):
     """A custom implementation of commands.Context class."""
@@ -83,70 +112,60 @@ class Context(commands.Context["commands.Bot"], Generic[BotT]):
         perms = self.author.guild_permissions
         if perms.manage_guild or perms.manage_channels:
             return self.guild.default_role
-        try:
-            dj_role = self.guild.get_role(self.bot.server_config[self.guild.id]["dj_role"] or 0)
-            author_dj_role = discord.utils.find(
-                lambda r: r.name.lower() == "dj",
-                self.author.roles,
-            )
-            server_dj_role = discord.utils.find(
-                lambda r: r.name.lower() == "dj",
-                self.guild.roles,
-            )
-            return dj_role or author_dj_role or server_dj_role
-        except KeyError:
-            if data := await self.bot.mongo.parrot_db.server_config.find_one(
-                {"_id": self.guild.id}
-            ):
-                return self.guild.get_role(data.get("dj_role") or 0)
-        return None
+        return await self._cfg_role("dj_role", "dj", prefer_author=True)
 
     async def muterole(
         self,
     ) -> Optional[discord.Role]:
-        try:
-            author_muted = discord.utils.find(
-                lambda m: m.name.lower() == "muted", self.author.roles
-            )
-            global_muted = discord.utils.find(
-                lambda m: m.name.lower() == "muted", self.guild.roles
-            )
-            return (
-                self.guild.get_role(self.bot.server_config[self.guild.id]["mute_role"] or 0)
-                or global_muted
-                or author_muted
-            )
-        except KeyError:
-            if data := await self.bot.mongo.parrot_db.server_config.find_one(
-                {"_id": self.guild.id}
-            ):
-                return self.guild.get_role(data["mute_role"] or 0)
-        return None
+        return await self._cfg_role("mute_role", "muted")
 
     async def modrole(
         self,
     ) -> Optional[discord.Role]:
-        try:
-            return self.guild.get_role(self.bot.server_config[self.guild.id]["mod_role"] or 0)
-        except KeyError:
-            if data := await self.bot.mongo.parrot_db.server_config.find_one(
-                {"_id": self.guild.id}
-            ):
-                return self.guild.get_role(data["mod_role"] or 0)
-        return None
+        return await self._cfg_role("mod_role")
+
+    async def _cfg_role(
+        self, key: str, fallback: Optional[str] = None, *, prefer_author: bool = False
+    ) -> Optional[discord.Role]:
+        """Role configured under ``key``, else the lowest role named ``fallback``
+        (one the author holds first, if ``prefer_author``)."""
+        data = await self.bot.get_server_config(self.guild.id)
+        if data is None:
+            return None
+        if role := self.guild.get_role(data.get(key) or 0):
+            return role
+        if fallback is None:
+            return None
+        named = _roles_named(self.guild, fallback)
+        if not named:
+            return None
+        if prefer_author:
+            return next((r for r in named if self.author.get_role(r.id)), named[0])
+        return named[0]
 
     @discord.utils.cached_property
     def replied_reference(self) -> Optional[discord.MessageReference]:
         ref = self.message.reference
-        if ref is not None and isinstance(ref.resolved, discord.Message):
-            return ref.resolved.to_reference()
+        if ref is None:
+            return None
+        resolved = ref.resolved
+        if isinstance(resolved, discord.Message):
+            return resolved.to_reference()
         return None
 
+    @discord.utils.cached_property
+    def _my_permissions(self) -> discord.Permissions:
+        return self.channel.permissions_for(self.me)
+
     def with_type(func):
+        # methods take the context after `self`
+        params = iter(inspect.signature(func).parameters)
+        ctx_index = 1 if next(params, None) == "self" else 0
+
         @functools.wraps(func)
         async def wrapped(*args: Any, **kwargs: Any):
 
-            context = args[0] if isinstance(args[0], commands.Context) else args[1]
+            context = args[ctx_index]
             try:
                 async with context.typing():
                     return await func(*args, **kwargs)
@@ -164,7 +183,7 @@ class Context(commands.Context["commands.Bot"], Generic[BotT]):
         underline: bool = False,
         **kwargs: Any,
     ) -> Optional[discord.Message]:
-        perms: discord.Permissions = self.channel.permissions_for(self.me)
+        perms: discord.Permissions = self._my_permissions
         if content is not None:
             if bold:
                 content = f"**{content}**"
@@ -173,7 +192,16 @@ class Context(commands.Context["commands.Bot"], Generic[BotT]):
             if underline:
                 content = f"__{content}__"
 
-        if not (perms.send_messages and perms.embed_links):
+        required = (
+            _SEND_EMBED_PERMISSIONS
+            if kwargs.get("embed") is not None or kwargs.get("embeds")
+            else _SEND_PERMISSIONS
+        )
+        if perms.value & required != required:
+            key = (self.channel.id, self.author.id)
+            if key in _missing_perms_warned:
+                return None
+            _missing_perms_warned[key] = True
             with suppress(discord.Forbidden):
                 await self.author.send(
                     "Bot don't have either Embed Links/Send Messages permission in that channel. "
@@ -212,9 +240,11 @@ class Context(commands.Context["commands.Bot"], Generic[BotT]):
         )
         if isinstance(msg, discord.Message):
             try:
-                await self.wait_for(
-                    "message_delete", check=lambda m: m.id == self.message.id, timeout=30
-                )
+                async with _timeout(30):
+                    await self.bot.wait_for(
+                        "message_delete",
+                        check=lambda m, _id=self.message.id: m.id == _id,
+                    )
             except asyncio.TimeoutError:
                 return msg
             else:
@@ -222,22 +252,16 @@ class Context(commands.Context["commands.Bot"], Generic[BotT]):
         return msg
 
     async def entry_to_code(self, entries: List[Tuple[Any, Any]]) -> Optional[discord.Message]:
-        width = max(len(str(a)) for a, b in entries)
-        output = ["```"]
-        for name, entry in entries:
-            output.append(f"{name:<{width}}: {entry}")
-        output.append("```")
-        return await self.send("\n".join(output))
+        width = max(len(str(a)) for a, _ in entries)
+        rows = "\n".join(f"{name:<{width}}: {entry}" for name, entry in entries)
+        return await self.send(f"```\n{rows}\n```")
 
     async def indented_entry_to_code(
         self, entries: List[Tuple[Any, Any]]
     ) -> Optional[discord.Message]:
-        width = max(len(str(a)) for a, b in entries)
-        output = ["```"]
-        for name, entry in entries:
-            output.append(f"\u200b{name:>{width}}: {entry}")
-        output.append("```")
-        return await self.send("\n".join(output))
+        width = max(len(str(a)) for a, _ in entries)
+        rows = "\n".join(f"\u200b{name:>{width}}: {entry}" for name, entry in entries)
+        return await self.send(f"```\n{rows}\n```")
 
     async def emoji(self, emoji: str) -> str:
         return emojis[emoji]
@@ -290,19 +314,22 @@ class Context(commands.Context["commands.Bot"], Generic[BotT]):
         return view.value
 
     async def release(self, _for: Union[int, float, datetime.datetime] = None) -> None:
+        if not _for:
+            return
         if isinstance(_for, datetime.datetime):
             await discord.utils.sleep_until(_for)
-        else:
-            await asyncio.sleep(_for or 0)
+        elif _for > 0:
+            await asyncio.sleep(_for)
 
     async def safe_send(
         self, content: str, *, escape_mentions: bool = True, **kwargs: Any
     ) -> Optional[discord.Message]:
-        if escape_mentions:
+        # every mention form contains "@"
+        if escape_mentions and "@" in content:
             content = discord.utils.escape_mentions(content)
 
         if len(content) > 2000:
-            fp = io.BytesIO(content.encode())
+            fp = io.BytesIO(content.encode("utf-8"))
             kwargs.pop("file", None)
             return await self.send(
                 file=discord.File(fp, filename="message_too_long.txt"), **kwargs
@@ -314,8 +341,10 @@ class Context(commands.Context["commands.Bot"], Generic[BotT]):
         message: discord.Message,
         *reactions: Union[discord.Emoji, discord.PartialEmoji, str],
     ) -> None:
-        coros = [asyncio.ensure_future(message.add_reaction(reaction)) for reaction in reactions]
-        await asyncio.wait(coros)
+        # one at a time so they show up in the given order
+        for reaction in reactions:
+            with suppress(discord.HTTPException):
+                await message.add_reaction(reaction)
 
     async def confirm(
         self,
@@ -351,16 +380,22 @@ class Context(commands.Context["commands.Bot"], Generic[BotT]):
         message = await channel.send(*args, **kwargs)
         await self.bulk_add_reactions(message, *CONFIRM_REACTIONS)
 
-        def check(payload: discord.RawReactionActionEvent) -> bool:
+        # str() of a unicode emoji is its name
+        def check(
+            payload: discord.RawReactionActionEvent,
+            _message_id: int = message.id,
+            _user_id: int = user.id,
+        ) -> bool:
             return (
-                payload.message_id == message.id
-                and payload.user_id == user.id
-                and str(payload.emoji) in CONFIRM_REACTIONS
+                payload.message_id == _message_id
+                and payload.user_id == _user_id
+                and payload.emoji.name in CONFIRM_REACTIONS_SET
             )
 
         try:
-            payload = await self.bot.wait_for("raw_reaction_add", check=check, timeout=timeout)
-            return str(payload.emoji) == "\N{THUMBS UP SIGN}"
+            async with _timeout(timeout):
+                payload = await self.bot.wait_for("raw_reaction_add", check=check)
+            return payload.emoji.name == "\N{THUMBS UP SIGN}"
         except asyncio.TimeoutError:
             return None
         finally:
@@ -406,22 +441,21 @@ class Context(commands.Context["commands.Bot"], Generic[BotT]):
             if check is not None:
                 return check
 
-            def __suppress_attr_error(func: Callable, *args: Any, **kwargs: Any) -> bool:
-                """Suppress attribute error for the function."""
-                with suppress(AttributeError):
-                    func(*args, **kwargs)
-                    return True
-                return False
+            convert_pred = tuple((attrgetter(k.replace("__", ".")), v) for k, v in kw.items())
 
             def __check(
                 *args,
             ) -> bool:
                 """Main check function"""
-                convert_pred = [(attrgetter(k.replace("__", ".")), v) for k, v in kw.items()]
-                return all(
-                    all(pred(i) == val for i in args if __suppress_attr_error(pred, i))
-                    for pred, val in convert_pred
-                )
+                for pred, val in convert_pred:
+                    for i in args:
+                        try:
+                            if pred(i) != val:
+                                return False
+                        except AttributeError:
+                            # argument doesn't carry this attribute, skip it
+                            continue
+                return True
 
             return __check
 
@@ -429,9 +463,8 @@ class Context(commands.Context["commands.Bot"], Generic[BotT]):
             await discord.utils.maybe_coroutine(before_function)
 
         try:
-            return await self.bot.wait_for(
-                event_name, timeout=timeout, check=outer_check(**kwargs)
-            )
+            async with _timeout(timeout):
+                return await self.bot.wait_for(event_name, check=outer_check(**kwargs))
         except asyncio.TimeoutError:
             if error_function is not None:
                 await discord.utils.maybe_coroutine(error_function)
@@ -542,15 +575,20 @@ class Context(commands.Context["commands.Bot"], Generic[BotT]):
         if isinstance(events, dict):
             events = list(events.items())  # type: ignore
 
-        _events: Set[Coroutine[Any, Any, Any]] = {
-            self.wait_for(event, check=check, timeout=timeout, **kwargs) for event, check in events
-        }
+        # the waiters carry no timeout; whatever is left over gets cancelled
+        _events: List[asyncio.Task] = [
+            asyncio.create_task(self.wait_for(event, check=check, **kwargs))
+            for event, check in events
+        ]
 
-        return await asyncio.wait(
+        done, pending = await asyncio.wait(
             _events,
             timeout=timeout,
-            return_when=getattr(asyncio, return_when, "FIRST_COMPLETED"),
+            return_when=getattr(asyncio, return_when, asyncio.FIRST_COMPLETED),
         )
+        for task in pending:
+            task.cancel()
+        return done, pending
 
     async def wait_for_till(
         self,
@@ -589,20 +627,31 @@ class Context(commands.Context["commands.Bot"], Generic[BotT]):
             await self.release(after)
         done_result: List[Any] = []
 
-        _for = _for or 0
-        now = time.time() + _for
+        if not _for:
+            done, _ = await self.multiple_wait_for(events, return_when="FIRST_COMPLETED", **kwargs)
+            done_result.extend(task.result() for task in done)
+            return done_result
 
-        def __internal_appender(completed_result: Iterable[asyncio.Task]) -> None:
-            for task in completed_result:
-                done_result.append(task.result())
+        if isinstance(events, dict):
+            events = list(events.items())  # type: ignore
 
-        while time.time() <= now:
-            done, _ = await self.multiple_wait_for(events, return_when="FIRST_COMPLETED", **kwargs)
-            __internal_appender(done)
+        async def __collector(event: str, check: Callable[..., bool]) -> None:
+            while True:
+                done_result.append(await self.wait_for(event, check=check, **kwargs))
 
-        if not _for:
-            done, _ = await self.multiple_wait_for(events, return_when="FIRST_COMPLETED", **kwargs)
-            __internal_appender(done)
+        # one collector per event, running until the deadline below
+        collectors: List[asyncio.Task] = [
+            asyncio.create_task(__collector(event, check)) for event, check in events
+        ]
+        try:
+            done, _ = await asyncio.wait(
+                collectors, timeout=_for, return_when=asyncio.FIRST_EXCEPTION
+            )
+            for task in done:
+                task.result()  # collectors only finish by raising
+        finally:
+            for task in collectors:
+                task.cancel()
 
         return done_result
 
@@ -634,8 +683,8 @@ class ConfirmationView(discord.ui.View):
         return False
 
     async def on_timeout(self) -> None:
-        if self.reacquire:
-            await asyncio.sleep(0)
+        # `reacquire` is kept for signature compatibility; there is no pooled
+        # connection held while the prompt is open, so nothing to hand back
         if self.delete_after and self.message:
             await self.message.delete(delay=0)
 
@@ -10,6 +10,7 @@ import re
 import sys
 import traceback
 import types
+import weakref
 from collections import Counter, defaultdict, deque
 from contextlib import suppress
 from typing import (
@@ -67,7 +68,7 @@ from utilities.paste import Client
 
 from .__template import post as POST
 from .Cog import Cog
-from .Context import Context
+from .Context import Context, invalidate_role_name_cache
 
 os.environ["JISHAKU_HIDE"] = "True"
 os.environ["JISHAKU_NO_UNDERSCORE"] = "True"
@@ -168,6 +169,9 @@ class Parrot(commands.AutoShardedBot):
 
         # caching variables
         self.server_config: Dict[int, Dict[str, Any]] = LRU(256)  # type: ignore
+        self._server_config_locks: weakref.WeakValueDictionary[
+            int, asyncio.Lock
+        ] = weakref.WeakValueDictionary()
         self.message_cache: Dict[int, discord.Message] = {}
         self.banned_users: Dict[int, Dict[str, Union[str, bool, int]]] = {}
         self.afk: Set[int] = set()
@@ -337,6 +341,18 @@ class Parrot(commands.AutoShardedBot):
         """To run connect and login into discord"""
         super().run(TOKEN, reconnect=True)
 
+    async def on_guild_role_create(self, role: discord.Role) -> None:
+        invalidate_role_name_cache(role.guild.id)
+
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        invalidate_role_name_cache(role.guild.id)
+
+    async def on_guild_role_update(
+        self, before: discord.Role, after: discord.Role
+    ) -> None:
+        # renames and position changes both affect the lookup
+        invalidate_role_name_cache(after.guild.id)
+
     async def on_ready(self) -> None:
         if not hasattr(self, "uptime"):
             self.uptime = discord.utils.utcnow()
@@ -772,6 +788,28 @@ class Parrot(commands.AutoShardedBot):
 
         return None
 
+    async def get_server_config(self, guild_id: int) -> Optional[Dict[str, Any]]:
+        """Return the cached server config, loading it from the database on a miss.
+
+        Concurrent misses for the same guild share a single query.
+        """
+        try:
+            return self.server_config[guild_id]
+        except KeyError:
+            pass
+
+        lock = self._server_config_locks.get(guild_id)
+        if lock is None:
+            lock = self._server_config_locks[guild_id] = asyncio.Lock()
+        async with lock:
+            try:
+                return self.server_config[guild_id]
+            except KeyError:
+                pass
+            if data := await self.mongo.parrot_db.server_config.find_one({"_id": guild_id}):
+                self.server_config[guild_id] = data
+            return data
+
     @tasks.loop(count=1)
     async def update_server_config_cache(self, guild_id: int):
         if data := await self.mongo.parrot_db.server_config.find_one({"_id": guild_id}):
@@ -1,21 +1,285 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import math
 import random
+import time
+from collections import Counter, defaultdict
 from contextlib import suppress
+from typing import (
+    Callable,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 import discord
 from core import Cog, Context, Parrot
-from discord.ext import commands
+from discord.ext import commands, tasks
+from lru import LRU
+from pymongo import UpdateOne  # type: ignore
+from utilities.counter import flush_counter
 from utilities.exceptions import ParrotCheckFailure
 
 with open("extra/quote.txt") as f:
     quote_ = f.read()
 
-quote = quote_.split("\n")
+_QUOTES: Tuple[str, ...] = tuple(line for line in quote_.splitlines() if line.strip())
+del quote_
+
 QUESTION_MARK = "\N{BLACK QUESTION MARK ORNAMENT}"
 
+TITLE_BOT_MISSING_PERMISSIONS = f"{QUESTION_MARK} Bot Missing permissions {QUESTION_MARK}"
+TITLE_COMMAND_ON_COOLDOWN = f"{QUESTION_MARK} Command On Cooldown {QUESTION_MARK}"
+TITLE_MISSING_PERMISSIONS = f"{QUESTION_MARK} Missing permissions {QUESTION_MARK}"
+TITLE_MISSING_ROLE = f"{QUESTION_MARK} Missing Role {QUESTION_MARK}"
+TITLE_NSFW_CHANNEL_REQUIRED = f"{QUESTION_MARK} NSFW Channel Required {QUESTION_MARK}"
+TITLE_MESSAGE_NOT_FOUND = f"{QUESTION_MARK} Message Not Found {QUESTION_MARK}"
+TITLE_MEMBER_NOT_FOUND = f"{QUESTION_MARK} Member Not Found {QUESTION_MARK}"
+TITLE_USER_NOT_FOUND = f"{QUESTION_MARK} User Not Found {QUESTION_MARK}"
+TITLE_CHANNEL_NOT_FOUND = f"{QUESTION_MARK} Channel Not Found {QUESTION_MARK}"
+TITLE_ROLE_NOT_FOUND = f"{QUESTION_MARK} Role Not Found {QUESTION_MARK}"
+TITLE_EMOJI_NOT_FOUND = f"{QUESTION_MARK} Emoji Not Found {QUESTION_MARK}"
+TITLE_BAD_ARGUMENT = f"{QUESTION_MARK} Bad Argument {QUESTION_MARK}"
+TITLE_INVALID_SYNTAX = f"{QUESTION_MARK} Invalid Syntax {QUESTION_MARK}"
+TITLE_INVALID_LITERAL = f"{QUESTION_MARK} Invalid Literal(s) {QUESTION_MARK}"
+TITLE_MAX_CONCURRENCY = f"{QUESTION_MARK} Max Concurrenry Reached {QUESTION_MARK}"
+TITLE_UNEXPECTED_ERROR = f"{QUESTION_MARK} Unexpected Error {QUESTION_MARK}"
+TITLE_TIMEOUT_ERROR = f"{QUESTION_MARK} Timeout Error {QUESTION_MARK}"
+TITLE_EMBARRASSING = f"{QUESTION_MARK} Well this is embarrassing! {QUESTION_MARK}"
+
+
+def _prettify_perm(perm: str) -> str:
+    return perm.replace("_", " ").replace("guild", "server").title()
+
+
+PERM_PRETTY: Dict[str, str] = {
+    perm: _prettify_perm(perm) for perm in discord.Permissions.VALID_FLAGS
+}
+
+
+def _pretty_perm(perm: str) -> str:
+    try:
+        return PERM_PRETTY[perm]
+    except KeyError:
+        return _prettify_perm(perm)
+
+
+def _humanize(items: List[str], bold_sep: bool = False) -> str:
+    if len(items) <= 2:
+        return " and ".join(items)
+    sep = "**, **" if bold_sep else ", "
+    return f"{sep.join(items[:-1])}, and {items[-1]}"
+
+
+_IGNORED_ERRORS = (
+    commands.CommandNotFound,
+    discord.NotFound,
+    discord.Forbidden,
+    commands.PrivateMessageOnly,
+    commands.NotOwner,
+)
+
+
+ErrorHandler = Callable[[Context, Exception], Tuple[str, str, bool]]
+
+
+def _bot_missing_permissions(ctx: Context, error: commands.BotMissingPermissions):
+    missing = [_pretty_perm(perm) for perm in error.missing_permissions]
+    fmt = _humanize(missing)
+    return (
+        TITLE_BOT_MISSING_PERMISSIONS,
+        f"Please provide the following permission(s) to the bot.```\n{fmt}```",
+        False,
+    )
+
+
+def _command_on_cooldown(ctx: Context, error: commands.CommandOnCooldown):
+    return (
+        TITLE_COMMAND_ON_COOLDOWN,
+        f"You are on command cooldown, please retry in **{math.ceil(error.retry_after)}**s",
+        False,
+    )
+
+
+def _missing_permissions(ctx: Context, error: commands.MissingPermissions):
+    missing = [_pretty_perm(perm) for perm in error.missing_permissions]
+    fmt = _humanize(missing, bold_sep=True)
+    return (
+        TITLE_MISSING_PERMISSIONS,
+        f"You need the following permission(s) to the run the command.```\n{fmt}```",
+        True,
+    )
+
+
+def _missing_role(ctx: Context, error: commands.MissingRole):
+    missing = list(error.missing_role)
+    fmt = _humanize(missing, bold_sep=True)
+    return (
+        TITLE_MISSING_ROLE,
+        f"You need the the following role(s) to use the command```\n{fmt}```",
+        True,
+    )
+
+
+def _missing_any_role(ctx: Context, error: commands.MissingAnyRole):
+    missing = list(error.missing_roles)
+    fmt = _humanize(missing, bold_sep=True)
+    return (
+        TITLE_MISSING_ROLE,
+        f"You need the the following role(s) to use the command```\n{fmt}```",
+        True,
+    )
+
+
+def _bad_argument(ctx: Context, error: commands.BadArgument):
+    return TITLE_BAD_ARGUMENT, f"{error}", True
+
+
+def _usage_for(command: commands.Command) -> str:
+    # commands are rebuilt on reload, so this never goes stale
+    try:
+        return command._cached_usage
+    except AttributeError:
+        pass
+    aliases = "|".join(command.aliases) if command.aliases else ""
+    alias_sep = "|" if aliases else ""
+    command._cached_usage = (
+        f"{command.qualified_name}{alias_sep}{aliases} {command.signature}"
+    )
+    return command._cached_usage
+
+
+def _invalid_syntax(ctx: Context, error: commands.UserInputError):
+    return (
+        TITLE_INVALID_SYNTAX,
+        f"Please use proper syntax.```\n{ctx.clean_prefix}{_usage_for(ctx.command)}```",
+        True,
+    )
+
+
+def _bad_literal_argument(ctx: Context, error: commands.BadLiteralArgument):
+    return (
+        TITLE_INVALID_LITERAL,
+        (
+            f"Please use proper Literals."
+            f"Literal should be any one of the following: `{'`, `'.join(str(i) for i in error.literals)}`"
+        ),
+        False,
+    )
+
+
+def _parrot_check_failure(ctx: Context, error: ParrotCheckFailure):
+    return TITLE_UNEXPECTED_ERROR, f"{error.__str__().format(ctx=ctx)}", True
+
+
+def _check_any_failure(ctx: Context, error: commands.CheckAnyFailure):
+    return (
+        TITLE_UNEXPECTED_ERROR,
+        " or\n".join([error.__str__().format(ctx=ctx) for error in error.errors]),
+        True,
+    )
+
+
+# errors whose message never depends on the error or the context
+_STATIC_ERRORS: Dict[Type[Exception], Tuple[str, str, bool]] = {
+    commands.NSFWChannelRequired: (
+        TITLE_NSFW_CHANNEL_REQUIRED,
+        "This command will only run in NSFW marked channel. https://i.imgur.com/oe4iK5i.gif",
+        True,
+    ),
+    commands.MessageNotFound: (
+        TITLE_MESSAGE_NOT_FOUND,
+        "Message ID/Link you provied is either invalid or deleted",
+        True,
+    ),
+    commands.MemberNotFound: (
+        TITLE_MEMBER_NOT_FOUND,
+        "Member ID/Mention/Name you provided is invalid or bot can not see that Member",
+        True,
+    ),
+    commands.UserNotFound: (
+        TITLE_USER_NOT_FOUND,
+        "User ID/Mention/Name you provided is invalid or bot can not see that User",
+        True,
+    ),
+    commands.ChannelNotFound: (
+        TITLE_CHANNEL_NOT_FOUND,
+        "Channel ID/Mention/Name you provided is invalid or bot can not see that Channel",
+        True,
+    ),
+    commands.RoleNotFound: (
+        TITLE_ROLE_NOT_FOUND,
+        "Role ID/Mention/Name you provided is invalid or bot can not see that Role",
+        True,
+    ),
+    commands.EmojiNotFound: (
+        TITLE_EMOJI_NOT_FOUND,
+        "Emoji ID/Name you provided is invalid or bot can not see that Emoji",
+        True,
+    ),
+    commands.MaxConcurrencyReached: (
+        TITLE_MAX_CONCURRENCY,
+        "This command is already running in this server/channel by you. You have wait for it to finish",
+        False,
+    ),
+    asyncio.TimeoutError: (
+        TITLE_TIMEOUT_ERROR,
+        "Command took too long to respond",
+        False,
+    ),
+}
+
+# prebuilt embeds for the static errors, copied per use
+_STATIC_EMBEDS: Dict[Type[Exception], discord.Embed] = {
+    cls: discord.Embed(title=title, description=description)
+    for cls, (title, description, _) in _STATIC_ERRORS.items()
+}
+_STATIC_EMBEDS[commands.NSFWChannelRequired].set_image(
+    url="https://i.imgur.com/oe4iK5i.gif"
+)
+
+_FALLBACK_EMBED = discord.Embed(title=TITLE_EMBARRASSING)
+
+# looked up along the error's MRO together with _STATIC_ERRORS, so the most
+# specific class wins
+_ERROR_HANDLERS: Dict[Type[Exception], ErrorHandler] = {
+    commands.BotMissingPermissions: _bot_missing_permissions,
+    commands.CommandOnCooldown: _command_on_cooldown,
+    commands.MissingPermissions: _missing_permissions,
+    commands.MissingRole: _missing_role,
+    commands.MissingAnyRole: _missing_any_role,
+    commands.BadArgument: _bad_argument,
+    commands.MissingRequiredArgument: _invalid_syntax,
+    commands.BadUnionArgument: _invalid_syntax,
+    commands.TooManyArguments: _invalid_syntax,
+    commands.BadLiteralArgument: _bad_literal_argument,
+    ParrotCheckFailure: _parrot_check_failure,
+    commands.CheckAnyFailure: _check_any_failure,
+}
+
+WEBHOOK_CACHE_TTL = 300
+# seconds to collect logging messages before posting them as one webhook message
+WEBHOOK_FLUSH_DELAY = 2.0
+
+# cog name -> (logging key, header, author label, Parrot method run before logging)
+_COG_WEBHOOKS: Dict[str, Tuple[str, str, str, Optional[str]]] = {
+    "moderator": ("on_mod_commands", "On Moderator Command", "Mod    ", None),
+    "configuration": (
+        "on_config_commands",
+        "On Config Command",
+        "Admin  ",
+        "update_server_config_cache",
+    ),
+}
+_TRACKED_COGS: FrozenSet[str] = frozenset(_COG_WEBHOOKS)
+
 
 class ErrorView(discord.ui.View):
     def __init__(self, author_id, *, ctx: Context = None, error: commands.CommandError = None):
@@ -43,16 +307,111 @@ class Cmd(Cog, command_attrs=dict(hidden=True)):
     def __init__(self, bot: Parrot):
         self.bot = bot
         self.collection = bot.mongo.parrot_db["logging"]
+        self._cmd_counts: Counter[str] = Counter()
+        # (guild_id, logging key) -> (fetched at, webhook url or None)
+        self._webhook_cache: Dict[Tuple[int, str], Tuple[float, Optional[str]]] = LRU(
+            1024
+        )  # type: ignore
+        # strong refs so in-flight webhook sends are not garbage collected
+        self._pending_tasks: Set[asyncio.Task] = set()
+        # webhook url -> messages waiting for the next flush
+        self._webhook_buffers: DefaultDict[str, List[str]] = defaultdict(list)
+        self._webhook_flush_handles: Dict[str, asyncio.TimerHandle] = {}
+        # username/avatar_url kwargs for webhook.send, resolved on first flush
+        self._webhook_identity: Optional[Dict[str, str]] = None
+        self._webhook_objs: Dict[str, discord.Webhook] = LRU(1024)  # type: ignore
+        # invoking message id -> error reply, deleted along with the invocation
+        self._pending_error_replies: Dict[int, discord.Message] = {}
+
+        self.cmd_count_flusher.start()
+
+    async def cog_unload(self):
+        self.cmd_count_flusher.cancel()
+        await self.flush_cmd_counts()
+        for handle in self._webhook_flush_handles.values():
+            handle.cancel()
+        await asyncio.gather(
+            *(self._flush_webhook(url) for url in list(self._webhook_buffers))
+        )
+
+    async def flush_cmd_counts(self) -> None:
+        await flush_counter(
+            self._cmd_counts,
+            self.bot.mongo.parrot_db["cmd_count"],
+            lambda name, count: UpdateOne(
+                {"_id": name}, {"$inc": {"count": count}}, upsert=True
+            ),
+        )
+
+    @tasks.loop(seconds=5)
+    async def cmd_count_flusher(self):
+        await self.flush_cmd_counts()
+
+    async def _get_webhook_url(self, guild_id: int, key: str) -> Optional[str]:
+        now = time.monotonic()
+        try:
+            fetched_at, url = self._webhook_cache[(guild_id, key)]
+        except KeyError:
+            pass
+        else:
+            if now - fetched_at < WEBHOOK_CACHE_TTL:
+                return url
+
+        data = await self.collection.find_one(
+            {"_id": guild_id, key: {"$exists": True}}, {key: 1, "_id": 0}
+        )
+        url = data[key] if data else None
+        self._webhook_cache[(guild_id, key)] = (now, url)
+        return url
+
+    def _webhook(self, url: str) -> discord.Webhook:
+        webhook = self._webhook_objs.get(url)
+        if webhook is None:
+            webhook = discord.Webhook.from_url(url, session=self.bot.http_session)
+            self._webhook_objs[url] = webhook
+        return webhook
+
+    def _queue_webhook(self, url: str, content: str) -> None:
+        self._webhook_buffers[url].append(content)
+        if url not in self._webhook_flush_handles:
+            self._webhook_flush_handles[url] = self.bot.loop.call_later(
+                WEBHOOK_FLUSH_DELAY, self._schedule_webhook_flush, url
+            )
+
+    def _schedule_webhook_flush(self, url: str) -> None:
+        task = asyncio.create_task(self._flush_webhook(url))
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
+
+    async def _flush_webhook(self, url: str) -> None:
+        self._webhook_flush_handles.pop(url, None)
+        messages = self._webhook_buffers.pop(url, None)
+        if not messages:
+            return
+
+        chunks: List[str] = []
+        for message in messages:
+            if chunks and len(chunks[-1]) + 2 + len(message) <= 2000:
+                chunks[-1] = f"{chunks[-1]}\n\n{message}"
+            else:
+                chunks.append(message)
+
+        if self._webhook_identity is None:
+            self._webhook_identity = {
+                "username": self.bot.user.name,
+                "avatar_url": self.bot.user.display_avatar.url,
+            }
+        webhook = self._webhook(url)
+        for chunk in chunks:
+            with suppress(discord.HTTPException):
+                await webhook.send(content=chunk[:2000], **self._webhook_identity)
 
     @Cog.listener()
     async def on_command(self, ctx: Context):
         """This event will be triggered when the command is being completed; triggered by [discord.User]!"""
         if ctx.author.bot:
             return
-        collection = self.bot.mongo.parrot_db["cmd_count"]
-        await collection.update_one(
-            {"_id": ctx.command.qualified_name}, {"$inc": {"count": 1}}, upsert=True
-        )
+        self._cmd_counts[ctx.command.qualified_name] += 1
 
     @Cog.listener()
     async def on_command_completion(self, ctx: Context):
@@ -60,237 +419,74 @@ class Cmd(Cog, command_attrs=dict(hidden=True)):
         if ctx.cog is None:
             return
 
-        if ctx.cog.qualified_name.lower() == "moderator":
-            if data := await self.collection.find_one(
-                {"_id": ctx.guild.id, "on_mod_commands": {"$exists": True}}
-            ):
-                webhook: discord.Webhook = discord.Webhook.from_url(
-                    data["on_mod_commands"], session=self.bot.http_session
-                )
-                with suppress(discord.HTTPException):
-                    main_content = f"""**On Moderator Command**
-
-`Mod    `: **{ctx.author}**
-`Command`: **{ctx.command.qualified_name}**
-`Content`: **{ctx.message.content}**
-"""
-                    await webhook.send(
-                        content=main_content,
-                        avatar_url=self.bot.user.display_avatar.url,
-                        username=self.bot.user.name,
-                    )
-
-        elif ctx.cog.qualified_name.lower() == "configuration":
-            await self.bot.update_server_config_cache(ctx.guild.id)
-            if data := await self.collection.find_one(
-                {"_id": ctx.guild.id, "on_config_commands": {"$exists": True}}
-            ):
-                webhook: discord.Webhook = discord.Webhook.from_url(
-                    data["on_config_commands"], session=self.bot.http_session
-                )
-                with suppress(discord.HTTPException):
-                    main_content = f"""**On Config Command**
-
-`Admin  `: **{ctx.author}**
+        name = ctx.cog.qualified_name.lower()
+        if name not in _TRACKED_COGS:
+            return
+        key, header, label, post = _COG_WEBHOOKS[name]
+
+        if post is not None:
+            await getattr(self.bot, post)(ctx.guild.id)
+            # a config command may have just changed the logging webhooks
+            self._webhook_cache.pop((ctx.guild.id, "on_mod_commands"), None)
+            self._webhook_cache.pop((ctx.guild.id, "on_config_commands"), None)
+
+        if url := await self._get_webhook_url(ctx.guild.id, key):
+            main_content = f"""**{header}**
+
+`{label}`: **{ctx.author}**
 `Command`: **{ctx.command.qualified_name}**
 `Content`: **{ctx.message.content}**
 """
-                    await webhook.send(
-                        content=main_content,
-                        avatar_url=self.bot.user.display_avatar.url,
-                        username=self.bot.user.name,
-                    )
+            self._queue_webhook(url, main_content)
 
     @Cog.listener()
     async def on_command_error(self, ctx: Context, error: commands.CommandError):
-        await self.bot.wait_until_ready()
-        # elif command has local error handler, return
-        if hasattr(ctx.command, "on_error"):
-            return
-
         # get the original exception
         error = getattr(error, "original", error)
-
-        ignore = (
-            commands.CommandNotFound,
-            discord.NotFound,
-            discord.Forbidden,
-            commands.PrivateMessageOnly,
-            commands.NotOwner,
-        )
-
-        if isinstance(error, ignore):
+        if isinstance(error, _IGNORED_ERRORS):
             return
 
-        ERROR_EMBED = discord.Embed()
-        if isinstance(error, commands.BotMissingPermissions):
-            missing = [
-                perm.replace("_", " ").replace("guild", "server").title()
-                for perm in error.missing_permissions
-            ]
-            if len(missing) > 2:
-                fmt = "{}, and {}".format(", ".join(missing[:-1]), missing[-1])
-            else:
-                fmt = " and ".join(missing)
-            ERROR_EMBED.description = (
-                f"Please provide the following permission(s) to the bot.```\n{fmt}```"
-            )
-            ERROR_EMBED.title = f"{QUESTION_MARK} Bot Missing permissions {QUESTION_MARK}"
-
-        elif isinstance(error, commands.CommandOnCooldown):
-            ERROR_EMBED.description = (
-                f"You are on command cooldown, please retry in **{math.ceil(error.retry_after)}**s"
-            )
-            ERROR_EMBED.title = f"{QUESTION_MARK} Command On Cooldown {QUESTION_MARK}"
-
-        elif isinstance(error, commands.MissingPermissions):
-            missing = [
-                perm.replace("_", " ").replace("guild", "server").title()
-                for perm in error.missing_permissions
-            ]
-            if len(missing) > 2:
-                fmt = "{}, and {}".format("**, **".join(missing[:-1]), missing[-1])
-            else:
-                fmt = " and ".join(missing)
-            ERROR_EMBED.description = (
-                f"You need the following permission(s) to the run the command.```\n{fmt}```"
-            )
-            ERROR_EMBED.title = f"{QUESTION_MARK} Missing permissions {QUESTION_MARK}"
-            ctx.command.reset_cooldown(ctx)
-
-        elif isinstance(error, commands.MissingRole):
-            missing = list(error.missing_role)
-            if len(missing) > 2:
-                fmt = "{}, and {}".format("**, **".join(missing[:-1]), missing[-1])
-            else:
-                fmt = " and ".join(missing)
-            ERROR_EMBED.description = (
-                f"You need the the following role(s) to use the command```\n{fmt}```"
-            )
-            ERROR_EMBED.title = f"{QUESTION_MARK} Missing Role {QUESTION_MARK}"
-            ctx.command.reset_cooldown(ctx)
-
-        elif isinstance(error, commands.MissingAnyRole):
-            missing = list(error.missing_roles)
-            if len(missing) > 2:
-                fmt = "{}, and {}".format("**, **".join(missing[:-1]), missing[-1])
-            else:
-                fmt = " and ".join(missing)
-            ERROR_EMBED.description = (
-                f"You need the the following role(s) to use the command```\n{fmt}```"
-            )
-            ERROR_EMBED.title = f"{QUESTION_MARK} Missing Role {QUESTION_MARK}"
-            ctx.command.reset_cooldown(ctx)
-
-        elif isinstance(error, commands.NSFWChannelRequired):
-            ERROR_EMBED.description = "This command will only run in NSFW marked channel. https://i.imgur.com/oe4iK5i.gif"
-            ERROR_EMBED.title = f"{QUESTION_MARK} NSFW Channel Required {QUESTION_MARK}"
-            ERROR_EMBED.set_image(url="https://i.imgur.com/oe4iK5i.gif")
-            ctx.command.reset_cooldown(ctx)
-
-        elif isinstance(error, commands.BadArgument):
-            ctx.command.reset_cooldown(ctx)
-            if isinstance(error, commands.MessageNotFound):
-                ERROR_EMBED.description = (
-                    "Message ID/Link you provied is either invalid or deleted"
-                )
-                ERROR_EMBED.title = f"{QUESTION_MARK} Message Not Found {QUESTION_MARK}"
-
-            elif isinstance(error, commands.MemberNotFound):
-                ERROR_EMBED.description = (
-                    "Member ID/Mention/Name you provided is invalid or bot can not see that Member"
-                )
-                ERROR_EMBED.title = f"{QUESTION_MARK} Member Not Found {QUESTION_MARK}"
-
-            elif isinstance(error, commands.UserNotFound):
-                ERROR_EMBED.description = (
-                    "User ID/Mention/Name you provided is invalid or bot can not see that User"
-                )
-                ERROR_EMBED.title = f"{QUESTION_MARK} User Not Found {QUESTION_MARK}"
-
-            elif isinstance(error, commands.ChannelNotFound):
-                ERROR_EMBED.description = "Channel ID/Mention/Name you provided is invalid or bot can not see that Channel"
-                ERROR_EMBED.title = f"{QUESTION_MARK} Channel Not Found {QUESTION_MARK}"
-
-            elif isinstance(error, commands.RoleNotFound):
-                ERROR_EMBED.description = (
-                    "Role ID/Mention/Name you provided is invalid or bot can not see that Role"
-                )
-                ERROR_EMBED.title = f"{QUESTION_MARK} Role Not Found {QUESTION_MARK}"
-
-            elif isinstance(error, commands.EmojiNotFound):
-                ERROR_EMBED.description = (
-                    "Emoji ID/Name you provided is invalid or bot can not see that Emoji"
-                )
-                ERROR_EMBED.title = f"{QUESTION_MARK} Emoji Not Found {QUESTION_MARK}"
-
-            ERROR_EMBED.description = f"{error}"
-            ERROR_EMBED.title = f"{QUESTION_MARK} Bad Argument {QUESTION_MARK}"
-
-        elif isinstance(
-            error,
-            (
-                commands.MissingRequiredArgument,
-                commands.BadUnionArgument,
-                commands.TooManyArguments,
-            ),
-        ):
-            command = ctx.command
-            ctx.command.reset_cooldown(ctx)
-            ERROR_EMBED.description = (
-                f"Please use proper syntax.```\n{ctx.clean_prefix}"
-                f"{command.qualified_name}{'|' if command.aliases else ''}"
-                f"{'|'.join(command.aliases if command.aliases else '')} {command.signature}```"
-            )
-            ERROR_EMBED.title = f"{QUESTION_MARK} Invalid Syntax {QUESTION_MARK}"
-
-        elif isinstance(error, commands.BadLiteralArgument):
-            ERROR_EMBED.description = (
-                f"Please use proper Literals."
-                f"Literal should be any one of the following: `{'`, `'.join(str(i) for i in error.literals)}`"
-            )
-            ERROR_EMBED.title = f"{QUESTION_MARK} Invalid Literal(s) {QUESTION_MARK}"
-
-        elif isinstance(error, commands.MaxConcurrencyReached):
-            ERROR_EMBED.description = "This command is already running in this server/channel by you. You have wait for it to finish"
-            ERROR_EMBED.title = f"{QUESTION_MARK} Max Concurrenry Reached {QUESTION_MARK}"
-
-        elif isinstance(error, ParrotCheckFailure):
-            ctx.command.reset_cooldown(ctx)
-            ERROR_EMBED.description = f"{error.__str__().format(ctx=ctx)}"
-            ERROR_EMBED.title = f"{QUESTION_MARK} Unexpected Error {QUESTION_MARK}"
-
-        elif isinstance(error, commands.CheckAnyFailure):
-            ctx.command.reset_cooldown(ctx)
-            ERROR_EMBED.description = " or\n".join(
-                [error.__str__().format(ctx=ctx) for error in error.errors]
-            )
-            ERROR_EMBED.title = f"{QUESTION_MARK} Unexpected Error {QUESTION_MARK}"
+        # elif command has local error handler, return
+        if hasattr(ctx.command, "on_error"):
+            return
 
-        elif isinstance(error, asyncio.TimeoutError):
-            ERROR_EMBED.description = "Command took too long to respond"
-            ERROR_EMBED.title = f"{QUESTION_MARK} Timeout Error {QUESTION_MARK}"
+        await self.bot.wait_until_ready()
 
+        for cls in type(error).__mro__:
+            if cls in _STATIC_ERRORS:
+                reset_cooldown = _STATIC_ERRORS[cls][2]
+                ERROR_EMBED = copy.copy(_STATIC_EMBEDS[cls])
+                break
+            if cls in _ERROR_HANDLERS:
+                title, description, reset_cooldown = _ERROR_HANDLERS[cls](ctx, error)
+                ERROR_EMBED = discord.Embed(title=title, description=description)
+                break
         else:
+            reset_cooldown = False
+            ERROR_EMBED = copy.copy(_FALLBACK_EMBED)
             ERROR_EMBED.description = f"For some reason **{ctx.command.qualified_name}** is not working. If possible report this error."
-            ERROR_EMBED.title = f"{QUESTION_MARK} Well this is embarrassing! {QUESTION_MARK}"
+        if reset_cooldown:
+            ctx.command.reset_cooldown(ctx)
 
         msg: discord.Message = await ctx.reply(
-            random.choice(quote),
+            random.choice(_QUOTES),
             embed=ERROR_EMBED,
         )
 
-        try:
-            await ctx.wait_for(
-                "message_delete", timeout=10, check=lambda m: m.id == ctx.message.id
-            )
-        except asyncio.TimeoutError:
-            pass
-        else:
+        self._pending_error_replies[ctx.message.id] = msg
+        self.bot.loop.call_later(
+            10, self._pending_error_replies.pop, ctx.message.id, None
+        )
+
+        if ERROR_EMBED.title == TITLE_EMBARRASSING:
+            raise error
+
+    @Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        if not self._pending_error_replies:
+            return
+        if msg := self._pending_error_replies.pop(payload.message_id, None):
             await msg.delete(delay=0)
-        finally:
-            if ERROR_EMBED.title == f"{QUESTION_MARK} Well this is embarrassing! {QUESTION_MARK}":
-                raise error
 
 
 async def setup(bot: Parrot) -> None:
@@ -29,6 +29,11 @@ class Options(Enum):
     pn = "\N{CONFUSED FACE}"
 
 
+VALID_REACTIONS: Final[frozenset[str]] = frozenset(
+    {*(option.value for option in Options), BACK, STOP}
+)
+
+
 class BaseView(discord.ui.View):
     def disable_all(self) -> None:
         for button in self.children:
@@ -184,33 +189,34 @@ class Akinator:
         if self.delete_button:
             await self.message.add_reaction(STOP)
 
-        while self.aki.progression <= self.win_at:
-
-            def check(reaction: discord.Reaction, user: discord.User) -> bool:
-                emoji = str(reaction.emoji)
-                if reaction.message == self.message and user == ctx.author:
-                    try:
-                        return bool(Options(emoji))
-                    except ValueError:
-                        return emoji in (BACK, STOP)
+        def check(reaction: discord.Reaction, user: discord.User) -> bool:
+            return (
+                reaction.message == self.message
+                and user == ctx.author
+                and str(reaction.emoji) in VALID_REACTIONS
+            )
 
-            REACTION_ADD = ctx.bot.wait_for(
-                "reaction_add", timeout=timeout, check=check
+        while self.aki.progression <= self.win_at:
+            REACTION_ADD = asyncio.create_task(
+                ctx.bot.wait_for("reaction_add", timeout=timeout, check=check)
             )
-            REACTION_REMOVE = ctx.bot.wait_for(
-                "reaction_remove", timeout=timeout, check=check
+            REACTION_REMOVE = asyncio.create_task(
+                ctx.bot.wait_for("reaction_remove", timeout=timeout, check=check)
             )
 
-            try:
-                done, _ = await asyncio.wait(
-                    {REACTION_ADD, REACTION_REMOVE},
-                    return_when=asyncio.FIRST_COMPLETED,
-                    timeout=timeout,
-                )
-                for task in done:
-                    reaction, user = task.result()
-                    break
+            done, pending = await asyncio.wait(
+                {REACTION_ADD, REACTION_REMOVE},
+                return_when=asyncio.FIRST_COMPLETED,
+                timeout=timeout,
+            )
+            for task in pending:
+                task.cancel()
 
+            if not done:
+                return
+
+            try:
+                reaction, user = done.pop().result()
             except asyncio.TimeoutError:
                 return
 
@@ -11,6 +11,14 @@ from motor.motor_asyncio import AsyncIOMotorClient  # type: ignore
 from core import Parrot
 from utilities.config import TOKEN, my_secret
 
+try:
+    import uvloop  # type: ignore
+except ImportError:
+    # uvloop is POSIX-only; fall back to the default asyncio loop (e.g. on Windows)
+    pass
+else:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 bot = Parrot()
 
 
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import Callable, Counter, List, TypeVar
+
+from pymongo import UpdateOne  # type: ignore
+from pymongo.collection import Collection  # type: ignore
+from pymongo.errors import BulkWriteError, PyMongoError  # type: ignore
+
+K = TypeVar("K")
+
+
+async def flush_counter(
+    counter: Counter[K], collection: Collection, op: Callable[[K, int], UpdateOne]
+) -> None:
+    """Write the pending counts in one bulk_write. Counts that fail to write
+    are put back into `counter` for the next flush."""
+    if not counter:
+        return
+    pending = counter.copy()
+    counter.clear()
+    keys: List[K] = list(pending)
+    try:
+        await collection.bulk_write(
+            [op(key, pending[key]) for key in keys], ordered=False
+        )
+    except BulkWriteError as e:
+        # unordered: everything not listed in writeErrors was applied
+        for err in e.details.get("writeErrors", []):
+            key = keys[err["index"]]
+            counter[key] += pending[key]
+    except PyMongoError:
+        counter.update(pending)